@@ -7,7 +7,7 @@ from typing import TypedDict, Any, Dict, List, Optional
 from datetime import datetime, timezone
 from abc import ABC, abstractmethod
 import structlog
-from anthropic import Anthropic
+from anthropic import AsyncAnthropic
 import os
 import sys
 
@@ -15,13 +15,40 @@ import sys
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'tools'))
 
 try:
-    from gateway_api_client import HummingbotGatewayClient
+    from gateway_api_client import get_gateway_client
     GATEWAY_CLIENT_AVAILABLE = True
 except ImportError:
     GATEWAY_CLIENT_AVAILABLE = False
 
 logger = structlog.get_logger()
 
+# One Anthropic client per API key, so agents share its HTTP connection pool
+_anthropic_clients: Dict[str, AsyncAnthropic] = {}
+
+
+def get_anthropic_client(api_key: str) -> AsyncAnthropic:
+    """
+    Get the shared Anthropic client for an API key.
+
+    Args:
+        api_key: Anthropic API key
+
+    Returns:
+        Shared client instance
+    """
+    client = _anthropic_clients.get(api_key)
+    if client is None:
+        client = _anthropic_clients[api_key] = AsyncAnthropic(api_key=api_key)
+    return client
+
+
+async def shutdown_anthropic_clients():
+    """Close and forget every shared Anthropic client"""
+    clients = list(_anthropic_clients.values())
+    _anthropic_clients.clear()
+    for client in clients:
+        await client.close()
+
 
 class TradingState(TypedDict):
     """
@@ -100,12 +127,12 @@ class BaseAgent(ABC):
         self.config = config
         self.logger = logger.bind(agent_id=agent_id)
 
-        # Initialize Anthropic client
+        # Anthropic client is looked up per use via the client property
         api_key = config.get('anthropic_api_key') or os.getenv('ANTHROPIC_API_KEY')
         if not api_key:
             raise ValueError("ANTHROPIC_API_KEY not found in config or environment")
 
-        self.client = Anthropic(api_key=api_key)
+        self._anthropic_api_key = api_key
         self.model = config.get('model', 'claude-sonnet-4-20250514')
         self.max_tokens = config.get('max_tokens', 4096)
 
@@ -120,7 +147,7 @@ class BaseAgent(ABC):
             gateway_url = config.get('hummingbot_gateway_url', 'http://localhost:8000')
             gateway_username = config.get('hummingbot_username')
             gateway_password = config.get('hummingbot_password')
-            self.gateway_client = HummingbotGatewayClient(
+            self.gateway_client = get_gateway_client(
                 gateway_url=gateway_url,
                 username=gateway_username,
                 password=gateway_password
@@ -130,7 +157,14 @@ class BaseAgent(ABC):
             self.logger.warning("gateway_client_not_available",
                                message="Gateway client requested but not available")
 
-        self.logger.info("agent_initialized", config=self.config)
+        # The full config is large and repeated for every agent, so it is only rendered at DEBUG
+        self.logger.info("agent_initialized")
+        self.logger.debug("agent_config", config=self.config)
+
+    @property
+    def client(self) -> AsyncAnthropic:
+        """Shared Anthropic client, rebuilt if shutdown_anthropic_clients closed it"""
+        return get_anthropic_client(self._anthropic_api_key)
 
     async def execute(self, state: TradingState) -> TradingState:
         """
@@ -187,7 +221,8 @@ class BaseAgent(ABC):
         self,
         prompt: str,
         system_prompt: Optional[str] = None,
-        tools: Optional[List[Dict]] = None
+        tools: Optional[List[Dict]] = None,
+        tool_name: Optional[str] = None
     ) -> Any:
         """
         Call Claude API with the given prompt.
@@ -196,6 +231,7 @@ class BaseAgent(ABC):
             prompt: User prompt for Claude
             system_prompt: Optional system prompt
             tools: Optional list of tools for Claude to use
+            tool_name: Force Claude to call this tool instead of letting it choose
 
         Returns:
             Claude API response
@@ -209,16 +245,23 @@ class BaseAgent(ABC):
         }
 
         if system_prompt:
-            kwargs["system"] = system_prompt
+            # Sent as a cacheable block so a stable system prompt is not re-prefilled on every call
+            kwargs["system"] = [{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}]
 
         if tools:
-            kwargs["tools"] = tools
+            # Mark the end of the tool block so the API caches the definitions
+            # as a prompt prefix; the caller's list is left untouched
+            kwargs["tools"] = [*tools[:-1], {**tools[-1], "cache_control": {"type": "ephemeral"}}]
+
+        # Forcing a tool that was not offered is rejected by the API, so only force one that is
+        if tool_name and tools and any(tool.get("name") == tool_name for tool in tools):
+            kwargs["tool_choice"] = {"type": "tool", "name": tool_name}
 
         self.logger.debug("calling_claude",
                          prompt_length=len(prompt),
                          has_tools=bool(tools))
 
-        response = self.client.messages.create(**kwargs)
+        response = await self.client.messages.create(**kwargs)
 
         return response
 
@@ -5,6 +5,7 @@ Executes all types of trade exits
 
 from typing import Dict, Any
 from datetime import datetime, timezone
+import asyncio
 import structlog
 from agents.base import BaseAgent, TradingState
 
@@ -67,8 +68,12 @@ class ExitExecutionAgent(BaseAgent):
 
             exits_executed = []
 
-            for position in positions:
-                exit_result = await self._check_position_exit(position, state)
+            # Exit checks only read prices, so run them concurrently; the exits
+            # themselves are still sent one at a time in position order
+            exit_results = await asyncio.gather(
+                *(self._check_position_exit(position, state) for position in positions)
+            )
+            for position, exit_result in zip(positions, exit_results):
                 if exit_result and exit_result['should_exit']:
                     # Execute the exit
                     execution = await self._execute_exit(position, exit_result, state)
@@ -10,7 +10,7 @@ import structlog
 import asyncio
 import os
 from langgraph.graph import StateGraph, END
-from agents.base import TradingState
+from agents.base import TradingState, GATEWAY_CLIENT_AVAILABLE, shutdown_anthropic_clients
 
 logger = structlog.get_logger()
 
@@ -435,6 +435,13 @@ class MasterOrchestrator:
             self.logger.error("orchestrator_error", error=str(e))
             await self.emergency_shutdown(str(e))
 
+        finally:
+            # Agents share Gateway and Anthropic clients; release their connection pools
+            if GATEWAY_CLIENT_AVAILABLE:
+                from gateway_api_client import shutdown_gateway_clients
+                await shutdown_gateway_clients()
+            await shutdown_anthropic_clients()
+
     async def process_cycle(self) -> None:
         """Process one trading cycle"""
         self.logger.debug("processing_cycle", phase=self.session_state['phase'])
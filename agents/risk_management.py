@@ -5,12 +5,61 @@ Handles position sizing, risk calculations, and trade validation
 
 from typing import Dict, Any
 from datetime import datetime, timezone
+import numpy as np
 import structlog
 from agents.base import BaseAgent, TradingState
 
+# numba is optional; without it the kernels below run as plain Python
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 logger = structlog.get_logger()
 
 
+# Compiled on the first sizing call; cache=True keeps the machine code on disk
+# so later processes load it instead of recompiling
+@njit(cache=True)
+def _position_size_kernel(
+    balance, entry, stop, tick_size, tick_value, contract_size, min_size, max_size, risk_pct
+):
+    """
+    Numeric core of the YTC position size formula.
+
+    Returns:
+        Tuple of floats (risk_amount, stop_distance, stop_distance_ticks,
+        contracts, actual_risk, actual_risk_pct)
+    """
+    risk_amount = balance * (risk_pct / 100)
+    stop_distance = abs(entry - stop)
+
+    # Calculate stop distance in ticks
+    stop_distance_ticks = float(int(stop_distance / tick_size)) if tick_size > 0 else 0.0
+
+    if stop_distance_ticks > 0 and tick_value > 0:
+        position_size = risk_amount / (stop_distance_ticks * tick_value)
+
+        # Round to contract size, then enforce min/max limits
+        contracts = float(int(position_size / contract_size)) * contract_size
+        contracts = max(min_size, min(contracts, max_size))
+    else:
+        contracts = 0.0
+
+    # Actual risk with the rounded position size
+    actual_risk = contracts / contract_size * stop_distance_ticks * tick_value
+    actual_risk_pct = (actual_risk / balance) * 100 if balance > 0 else 0.0
+
+    return risk_amount, stop_distance, stop_distance_ticks, contracts, actual_risk, actual_risk_pct
+
+
 class RiskManagementAgent(BaseAgent):
     """
     Risk Management Agent
@@ -23,6 +72,9 @@ class RiskManagementAgent(BaseAgent):
     def __init__(self, agent_id: str, config: Dict[str, Any]):
         super().__init__(agent_id, config)
         self.risk_config = config.get('risk_config', {})
+        # Position sizing results keyed by their exact inputs, oldest first
+        self._sizing_cache: Dict[tuple, Dict[str, Any]] = {}
+        self._sizing_cache_max = 4096
 
     async def _execute_logic(self, state: TradingState) -> Dict[str, Any]:
         """
@@ -127,11 +179,17 @@ class RiskManagementAgent(BaseAgent):
 
         # Calculate risk from open positions
         positions = state.get('positions', [])
-        total_position_risk = sum(pos.get('risk_amount', 0) for pos in positions)
+        position_risk = np.fromiter(
+            (pos.get('risk_amount', 0) for pos in positions), dtype=np.float64, count=len(positions)
+        )
+        total_position_risk = float(position_risk.sum())
         position_risk_pct = (total_position_risk / account_balance) * 100 if account_balance > 0 else 0
 
         # Calculate total exposure
-        total_exposure = sum(abs(pos.get('notional_value', 0)) for pos in positions)
+        notional = np.fromiter(
+            (pos.get('notional_value', 0) for pos in positions), dtype=np.float64, count=len(positions)
+        )
+        total_exposure = float(np.abs(notional).sum())
         exposure_pct = (total_exposure / account_balance) * 100 if account_balance > 0 else 0
 
         # Risk utilization (how much of max session risk is used)
@@ -228,14 +286,14 @@ class RiskManagementAgent(BaseAgent):
         if not trades:
             return 0
 
-        consecutive = 0
-        for trade in reversed(trades):
-            if trade.get('pnl', 0) < 0:
-                consecutive += 1
-            else:
-                break
+        pnl = np.fromiter((trade.get('pnl', 0) for trade in trades), dtype=np.float64, count=len(trades))
+
+        # The losing streak runs from the last non-losing trade to the end
+        not_losing = np.flatnonzero(~(pnl < 0))
+        if not_losing.size == 0:
+            return len(trades)
 
-        return consecutive
+        return int(len(trades) - 1 - not_losing[-1])
 
     def calculate_position_size(
         self,
@@ -260,38 +318,44 @@ class RiskManagementAgent(BaseAgent):
         Returns:
             Position sizing details
         """
-        risk_amount = account_balance * (risk_pct / 100)
-        stop_distance = abs(entry_price - stop_price)
-
         tick_size = instrument_spec.get('tick_size', 0.0001)
         tick_value = instrument_spec.get('tick_value', 10.0)
+        contract_size = instrument_spec.get('contract_size', 1000)
         min_size = instrument_spec.get('min_size', 1000)
         max_size = instrument_spec.get('max_size', 1000000)
 
-        # Calculate stop distance in ticks
-        stop_distance_ticks = int(stop_distance / tick_size) if tick_size > 0 else 0
-
-        # Calculate position size
-        if stop_distance_ticks > 0 and tick_value > 0:
-            position_size = risk_amount / (stop_distance_ticks * tick_value)
-
-            # Round to contract size
-            contract_size = instrument_spec.get('contract_size', 1000)
-            position_size_contracts = int(position_size / contract_size) * contract_size
-
-            # Enforce min/max limits
-            position_size_contracts = max(min_size, min(position_size_contracts, max_size))
-
-        else:
-            position_size_contracts = 0
+        inputs = (
+            account_balance, entry_price, stop_price,
+            tick_size, tick_value, contract_size, min_size, max_size, risk_pct
+        )
+        # Types are part of the key since 1 == 1.0 but the result keeps the caller's types
+        cache_key = inputs + tuple(map(type, inputs))
+        cached = self._sizing_cache.get(cache_key)
+        if cached is not None:
+            return dict(cached)
+
+        (
+            risk_amount,
+            stop_distance,
+            stop_distance_ticks,
+            position_size_contracts,
+            actual_risk,
+            actual_risk_pct
+        ) = _position_size_kernel(
+            float(account_balance), float(entry_price), float(stop_price),
+            float(tick_size), float(tick_value), float(contract_size),
+            float(min_size), float(max_size), float(risk_pct)
+        )
 
-        # Calculate actual risk with rounded position size
-        actual_risk = position_size_contracts / instrument_spec.get('contract_size', 1000) * stop_distance_ticks * tick_value
-        actual_risk_pct = (actual_risk / account_balance) * 100 if account_balance > 0 else 0
+        # The kernel works in floats; tick counts are whole numbers, and so are
+        # contract counts when the instrument's sizes are integers
+        stop_distance_ticks = int(stop_distance_ticks)
+        if all(isinstance(v, int) for v in (contract_size, min_size, max_size)):
+            position_size_contracts = int(position_size_contracts)
 
-        return {
+        result = {
             'position_size_contracts': position_size_contracts,
-            'position_size_lots': position_size_contracts / instrument_spec.get('contract_size', 1000),
+            'position_size_lots': position_size_contracts / contract_size,
             'risk_amount_target': risk_amount,
             'risk_amount_actual': actual_risk,
             'risk_pct_target': risk_pct,
@@ -302,6 +366,13 @@ class RiskManagementAgent(BaseAgent):
             'stop_price': stop_price
         }
 
+        if len(self._sizing_cache) >= self._sizing_cache_max:
+            # Evict the oldest entry
+            del self._sizing_cache[next(iter(self._sizing_cache))]
+        self._sizing_cache[cache_key] = result
+
+        return dict(result)
+
     def validate_trade(
         self,
         trade_request: Dict[str, Any],
@@ -5,6 +5,7 @@ Manages open positions with trailing stops and partial exits
 
 from typing import Dict, Any, List
 from datetime import datetime, timezone
+import asyncio
 import structlog
 from agents.base import BaseAgent, TradingState
 
@@ -51,8 +52,11 @@ class TradeManagementAgent(BaseAgent):
 
             management_actions = []
 
-            for position in positions:
-                actions = await self._manage_position(position, state)
+            # Positions are evaluated independently, so their price lookups can overlap
+            position_actions = await asyncio.gather(
+                *(self._manage_position(position, state) for position in positions)
+            )
+            for actions in position_actions:
                 if actions:
                     management_actions.extend(actions)
 
@@ -14,6 +14,12 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from agents.orchestrator import MasterOrchestrator
 
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 
 async def main():
     """Run a simple workflow demonstration"""
@@ -109,6 +115,10 @@ async def main():
 
 
 if __name__ == "__main__":
+    # uvloop's event loop dispatches socket I/O faster than the default one
+    if UVLOOP_AVAILABLE:
+        uvloop.install()
+
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
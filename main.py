@@ -13,6 +13,7 @@ from agents.orchestrator import MasterOrchestrator
 # Configure logging
 structlog.configure(
     processors=[
+        structlog.stdlib.filter_by_level,
         structlog.processors.TimeStamper(fmt="iso"),
         structlog.stdlib.add_log_level,
         structlog.processors.StackInfoRenderer(),
@@ -4,11 +4,38 @@ YTC Fibonacci retracement and extension calculations
 """
 
 from __future__ import annotations
-from typing import Dict, List, Any
+from functools import lru_cache
+from typing import Dict, List, Any, Tuple
 import structlog
 
 logger = structlog.get_logger()
 
+# YTC standard Fibonacci levels
+RETRACEMENT_LEVELS = (0.236, 0.382, 0.500, 0.618, 0.786)
+EXTENSION_LEVELS = (1.272, 1.414, 1.618, 2.000, 2.618)
+
+# Five-element level vectors are too short to amortize NumPy ufunc dispatch,
+# so the kernels below use plain scalar arithmetic over these tuples
+_EXT_OFFSETS = tuple(level - 1 for level in EXTENSION_LEVELS)
+
+
+@lru_cache(maxsize=1024)
+def _retracements_core(swing_high: float, swing_low: float, bullish: bool) -> Tuple[float, ...]:
+    """Rounded retracement prices for a swing, memoized per (high, low, direction)."""
+    swing_range = swing_high - swing_low
+    if bullish:
+        return tuple(round(swing_high - swing_range * level, 5) for level in RETRACEMENT_LEVELS)
+    return tuple(round(swing_low + swing_range * level, 5) for level in RETRACEMENT_LEVELS)
+
+
+@lru_cache(maxsize=1024)
+def _extensions_core(swing_high: float, swing_low: float, bullish: bool) -> Tuple[float, ...]:
+    """Rounded extension prices for a swing, memoized per (high, low, direction)."""
+    swing_range = swing_high - swing_low
+    if bullish:
+        return tuple(round(swing_high + swing_range * offset, 5) for offset in _EXT_OFFSETS)
+    return tuple(round(swing_low - swing_range * offset, 5) for offset in _EXT_OFFSETS)
+
 
 class FibonacciSkill:
     """
@@ -16,9 +43,13 @@ class FibonacciSkill:
     Calculates retracement and extension levels
     """
 
-    # YTC standard Fibonacci levels
-    RETRACEMENT_LEVELS = [0.236, 0.382, 0.500, 0.618, 0.786]
-    EXTENSION_LEVELS = [1.272, 1.414, 1.618, 2.000, 2.618]
+    # YTC standard Fibonacci levels; the module tuples the kernels read, so read-only
+    RETRACEMENT_LEVELS = RETRACEMENT_LEVELS
+    EXTENSION_LEVELS = EXTENSION_LEVELS
+
+    # Level key names (derived once, not per call)
+    _RET_KEYS = tuple(f'fib_{int(level*100)}' for level in RETRACEMENT_LEVELS)
+    _EXT_KEYS = tuple(f'ext_{int(level*100)}' for level in EXTENSION_LEVELS)
 
     def __init__(self):
         self.logger = logger.bind(skill="fibonacci")
@@ -54,19 +85,12 @@ class FibonacciSkill:
                         direction=direction)
 
         swing_range = swing_high - swing_low
-        levels = {}
 
-        if direction == 'bullish':
-            # Retracements from high back down
-            for level in self.RETRACEMENT_LEVELS:
-                price = swing_high - (swing_range * level)
-                levels[f'fib_{int(level*100)}'] = round(price, 5)
-
-        else:  # bearish
-            # Retracements from low back up
-            for level in self.RETRACEMENT_LEVELS:
-                price = swing_low + (swing_range * level)
-                levels[f'fib_{int(level*100)}'] = round(price, 5)
+        # Bullish retracements run from the high back down, bearish from the low back up
+        levels = dict(zip(
+            self._RET_KEYS,
+            _retracements_core(float(swing_high), float(swing_low), direction == 'bullish')
+        ))
 
         return {
             'swing_high': swing_high,
@@ -103,19 +127,12 @@ class FibonacciSkill:
                         direction=direction)
 
         swing_range = swing_high - swing_low
-        levels = {}
-
-        if direction == 'bullish':
-            # Extensions above swing_high
-            for level in self.EXTENSION_LEVELS:
-                price = swing_high + (swing_range * (level - 1))
-                levels[f'ext_{int(level*100)}'] = round(price, 5)
-
-        else:  # bearish
-            # Extensions below swing_low
-            for level in self.EXTENSION_LEVELS:
-                price = swing_low - (swing_range * (level - 1))
-                levels[f'ext_{int(level*100)}'] = round(price, 5)
+
+        # Bullish extensions project above swing_high, bearish below swing_low
+        levels = dict(zip(
+            self._EXT_KEYS,
+            _extensions_core(float(swing_high), float(swing_low), direction == 'bullish')
+        ))
 
         return {
             'swing_high': swing_high,
@@ -41,6 +41,159 @@ class PivotDetectionSkill:
         self.min_bars = min_bars
         self.logger = logger.bind(skill="pivot_detection")
 
+    def detect_swing_points_arrays(
+        self,
+        ohlc_data: pd.DataFrame,
+        swing_bars: int = 3
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Identify swing highs and lows, returned as parallel arrays.
+
+        Same detection rules as detect_swing_points, but each side is a
+        struct-of-arrays ({'index', 'price', 'timestamp'}) so downstream
+        analytics can work on contiguous price arrays without building a
+        dict per swing point.
+
+        Args:
+            ohlc_data: DataFrame with columns: timestamp, open, high, low, close
+            swing_bars: Number of bars on each side to validate swing
+
+        Returns:
+            Dictionary with swing_highs and swing_lows, each holding
+            index, price and timestamp arrays
+        """
+        self.logger.info("detecting_swing_points",
+                        bars=len(ohlc_data),
+                        swing_bars=swing_bars)
+
+        # Need at least swing_bars * 2 + 1 bars
+        if len(ohlc_data) < (swing_bars * 2 + 1):
+            self.logger.warning("insufficient_data", required=swing_bars * 2 + 1)
+            empty = np.empty(0, dtype=np.intp)
+            return {
+                'swing_highs': {'index': empty, 'price': np.empty(0), 'timestamp': np.empty(0, dtype=object)},
+                'swing_lows': {'index': empty, 'price': np.empty(0), 'timestamp': np.empty(0, dtype=object)}
+            }
+
+        highs = ohlc_data['high'].to_numpy(dtype=float)
+        lows = ohlc_data['low'].to_numpy(dtype=float)
+        is_swing_high, is_swing_low = self._swing_masks(highs, lows, swing_bars)
+
+        high_idx = np.flatnonzero(is_swing_high) + swing_bars
+        low_idx = np.flatnonzero(is_swing_low) + swing_bars
+
+        # Format only the confirmed swing bars; pandas timestamps keep their
+        # isoformat() output (offset and sub-second precision), anything else
+        # is stringified as is
+        timestamps = ohlc_data['timestamp']
+
+        def _format_timestamps(idx):
+            formatted = np.empty(len(idx), dtype=object)
+            formatted[:] = [
+                ts.isoformat() if isinstance(ts, pd.Timestamp) else str(ts)
+                for ts in timestamps.iloc[idx]
+            ]
+            return formatted
+
+        self.logger.info("swing_points_detected",
+                        swing_highs=len(high_idx),
+                        swing_lows=len(low_idx))
+
+        return {
+            'swing_highs': {
+                'index': high_idx,
+                'price': highs[high_idx],
+                'timestamp': _format_timestamps(high_idx)
+            },
+            'swing_lows': {
+                'index': low_idx,
+                'price': lows[low_idx],
+                'timestamp': _format_timestamps(low_idx)
+            }
+        }
+
+    @staticmethod
+    def _swing_masks(highs: np.ndarray, lows: np.ndarray, swing_bars: int):
+        """
+        Build swing high/low masks along the last axis.
+
+        Candidate bars must beat every bar within swing_bars on both sides.
+        Works on a single (N,) series or a stacked (S, N) block.
+
+        Args:
+            highs: High prices, bars on the last axis
+            lows: Low prices, bars on the last axis
+            swing_bars: Number of bars on each side to validate swing
+
+        Returns:
+            Tuple of boolean masks covering bars swing_bars..N-swing_bars-1
+        """
+        n = highs.shape[-1]
+        center = np.s_[..., swing_bars:n - swing_bars]
+        mask_shape = highs.shape[:-1] + (n - 2 * swing_bars,)
+        is_swing_high = np.ones(mask_shape, dtype=bool)
+        is_swing_low = np.ones(mask_shape, dtype=bool)
+
+        for j in range(1, swing_bars + 1):
+            left = np.s_[..., swing_bars - j:n - swing_bars - j]
+            right = np.s_[..., swing_bars + j:n - swing_bars + j]
+            is_swing_high &= (highs[center] > highs[left]) & (highs[center] > highs[right])
+            is_swing_low &= (lows[center] < lows[left]) & (lows[center] < lows[right])
+
+        return is_swing_high, is_swing_low
+
+    def detect_swing_points_multi(
+        self,
+        ohlc_stack: np.ndarray,
+        swing_bars: int = 3
+    ) -> List[Dict[str, Dict[str, Any]]]:
+        """
+        Identify swing highs and lows for several instruments at once.
+
+        The comparisons run over the whole (S, N) block in one pass, so a
+        watchlist costs a handful of array operations rather than one scan
+        per symbol.
+
+        Args:
+            ohlc_stack: Array of shape (S, N, 2) holding high, low per symbol
+            swing_bars: Number of bars on each side to validate swing
+
+        Returns:
+            One entry per symbol with swing_highs and swing_lows, each
+            holding index and price arrays
+        """
+        ohlc_stack = np.asarray(ohlc_stack, dtype=float)
+        if ohlc_stack.ndim != 3 or ohlc_stack.shape[2] != 2:
+            raise ValueError(f"Expected an (S, N, 2) array, got shape {ohlc_stack.shape}")
+
+        n_symbols, n = ohlc_stack.shape[:2]
+        self.logger.info("detecting_swing_points_multi",
+                        symbols=n_symbols,
+                        bars=n,
+                        swing_bars=swing_bars)
+
+        empty = {'index': np.empty(0, dtype=np.intp), 'price': np.empty(0)}
+        if n < (swing_bars * 2 + 1):
+            self.logger.warning("insufficient_data", required=swing_bars * 2 + 1)
+            return [{'swing_highs': dict(empty), 'swing_lows': dict(empty)}
+                    for _ in range(n_symbols)]
+
+        highs = ohlc_stack[:, :, 0]
+        lows = ohlc_stack[:, :, 1]
+        is_swing_high, is_swing_low = self._swing_masks(highs, lows, swing_bars)
+
+        # Only the sparse swing bars are gathered per symbol
+        results = []
+        for s in range(n_symbols):
+            high_idx = np.flatnonzero(is_swing_high[s]) + swing_bars
+            low_idx = np.flatnonzero(is_swing_low[s]) + swing_bars
+            results.append({
+                'swing_highs': {'index': high_idx, 'price': highs[s, high_idx]},
+                'swing_lows': {'index': low_idx, 'price': lows[s, low_idx]}
+            })
+
+        return results
+
     def detect_swing_points(
         self,
         ohlc_data: pd.DataFrame,
@@ -55,6 +208,9 @@ class PivotDetectionSkill:
         A swing low requires:
         - Current bar low < N bars to left AND right
 
+        Thin wrapper over detect_swing_points_arrays for callers that need
+        one dict per swing point.
+
         Args:
             ohlc_data: DataFrame with columns: timestamp, open, high, low, close
             swing_bars: Number of bars on each side to validate swing
@@ -62,78 +218,62 @@ class PivotDetectionSkill:
         Returns:
             Dictionary with swing_highs and swing_lows arrays
         """
-        self.logger.info("detecting_swing_points",
-                        bars=len(ohlc_data),
-                        swing_bars=swing_bars)
+        arrays = self.detect_swing_points_arrays(ohlc_data, swing_bars)
+
+        def _to_points(side):
+            return [
+                {
+                    'index': index,
+                    'price': price,
+                    'timestamp': timestamp,
+                    'bar_count': swing_bars
+                }
+                for index, price, timestamp in zip(
+                    side['index'].tolist(),
+                    side['price'].tolist(),
+                    side['timestamp'].tolist()
+                )
+            ]
 
-        swing_highs = []
-        swing_lows = []
+        return {
+            'swing_highs': _to_points(arrays['swing_highs']),
+            'swing_lows': _to_points(arrays['swing_lows'])
+        }
 
-        # Need at least swing_bars * 2 + 1 bars
-        if len(ohlc_data) < (swing_bars * 2 + 1):
-            self.logger.warning("insufficient_data", required=swing_bars * 2 + 1)
-            return {'swing_highs': [], 'swing_lows': []}
-
-        # Iterate through potential swing points
-        for i in range(swing_bars, len(ohlc_data) - swing_bars):
-
-            # Check for swing high
-            current_high = ohlc_data.iloc[i]['high']
-            is_swing_high = True
-
-            for j in range(1, swing_bars + 1):
-                left_high = ohlc_data.iloc[i - j]['high']
-                right_high = ohlc_data.iloc[i + j]['high']
-
-                if left_high >= current_high or right_high >= current_high:
-                    is_swing_high = False
-                    break
-
-            if is_swing_high:
-                swing_highs.append({
-                    'index': i,
-                    'price': float(current_high),
-                    'timestamp': ohlc_data.iloc[i]['timestamp'].isoformat() if isinstance(
-                        ohlc_data.iloc[i]['timestamp'], pd.Timestamp
-                    ) else str(ohlc_data.iloc[i]['timestamp']),
-                    'bar_count': swing_bars
-                })
+    @staticmethod
+    def _point_prices(points) -> np.ndarray:
+        """
+        Get swing point prices as a float array.
 
-            # Check for swing low
-            current_low = ohlc_data.iloc[i]['low']
-            is_swing_low = True
-
-            for j in range(1, swing_bars + 1):
-                left_low = ohlc_data.iloc[i - j]['low']
-                right_low = ohlc_data.iloc[i + j]['low']
-
-                if left_low <= current_low or right_low <= current_low:
-                    is_swing_low = False
-                    break
-
-            if is_swing_low:
-                swing_lows.append({
-                    'index': i,
-                    'price': float(current_low),
-                    'timestamp': ohlc_data.iloc[i]['timestamp'].isoformat() if isinstance(
-                        ohlc_data.iloc[i]['timestamp'], pd.Timestamp
-                    ) else str(ohlc_data.iloc[i]['timestamp']),
-                    'bar_count': swing_bars
-                })
+        Args:
+            points: Struct-of-arrays swing dict or legacy list of point dicts
 
-        self.logger.info("swing_points_detected",
-                        swing_highs=len(swing_highs),
-                        swing_lows=len(swing_lows))
+        Returns:
+            Array of prices
+        """
+        if isinstance(points, dict):
+            return np.asarray(points['price'], dtype=float)
+        return np.fromiter((p['price'] for p in points), dtype=float, count=len(points))
 
-        return {
-            'swing_highs': swing_highs,
-            'swing_lows': swing_lows
-        }
+    @staticmethod
+    def _point_timestamps(points) -> List[Any]:
+        """
+        Get swing point timestamps as a list.
+
+        Args:
+            points: Struct-of-arrays swing dict or legacy list of point dicts
+
+        Returns:
+            List of timestamps
+        """
+        if isinstance(points, dict):
+            return list(points['timestamp'])
+        return [p['timestamp'] for p in points]
 
     def classify_trend(
         self,
-        swing_highs: List[Dict],
-        swing_lows: List[Dict]
+        swing_highs,
+        swing_lows
     ) -> Dict[str, Any]:
         """
         Classify trend based on swing points.
@@ -144,42 +284,34 @@ class PivotDetectionSkill:
         - Ranging: Mixed signals
 
         Args:
-            swing_highs: List of swing high points
-            swing_lows: List of swing low points
+            swing_highs: Swing high points (list of dicts or struct-of-arrays)
+            swing_lows: Swing low points (list of dicts or struct-of-arrays)
 
         Returns:
             Trend classification
         """
-        if len(swing_highs) < 2 or len(swing_lows) < 2:
+        high_prices = self._point_prices(swing_highs)
+        low_prices = self._point_prices(swing_lows)
+
+        if high_prices.size < 2 or low_prices.size < 2:
             return {
                 'trend': 'unknown',
                 'reason': 'Insufficient swing points',
                 'confidence': 0
             }
 
-        # Check recent swing highs (last 3)
-        recent_highs = swing_highs[-3:] if len(swing_highs) >= 3 else swing_highs
-        higher_highs = all(
-            recent_highs[i]['price'] > recent_highs[i-1]['price']
-            for i in range(1, len(recent_highs))
-        )
-
-        # Check recent swing lows (last 3)
-        recent_lows = swing_lows[-3:] if len(swing_lows) >= 3 else swing_lows
-        higher_lows = all(
-            recent_lows[i]['price'] > recent_lows[i-1]['price']
-            for i in range(1, len(recent_lows))
-        )
-
-        lower_highs = all(
-            recent_highs[i]['price'] < recent_highs[i-1]['price']
-            for i in range(1, len(recent_highs))
-        )
-
-        lower_lows = all(
-            recent_lows[i]['price'] < recent_lows[i-1]['price']
-            for i in range(1, len(recent_lows))
-        )
+        # Check recent swing highs and lows (last 3)
+        recent_highs = high_prices[-3:]
+        recent_lows = low_prices[-3:]
+        high_steps = np.diff(recent_highs)
+        low_steps = np.diff(recent_lows)
+
+        higher_highs = bool((high_steps > 0).all())
+        higher_lows = bool((low_steps > 0).all())
+        lower_highs = bool((high_steps < 0).all())
+        lower_lows = bool((low_steps < 0).all())
+        last_high = float(recent_highs[-1])
+        last_low = float(recent_lows[-1])
 
         # Determine trend
         if higher_highs and higher_lows:
@@ -187,82 +319,80 @@ class PivotDetectionSkill:
                 'trend': 'uptrend',
                 'reason': 'Higher highs and higher lows',
                 'confidence': 85,
-                'last_high': recent_highs[-1]['price'],
-                'last_low': recent_lows[-1]['price']
+                'last_high': last_high,
+                'last_low': last_low
             }
         elif lower_highs and lower_lows:
             return {
                 'trend': 'downtrend',
                 'reason': 'Lower highs and lower lows',
                 'confidence': 85,
-                'last_high': recent_highs[-1]['price'],
-                'last_low': recent_lows[-1]['price']
+                'last_high': last_high,
+                'last_low': last_low
             }
         else:
             return {
                 'trend': 'ranging',
                 'reason': 'Mixed swing point pattern',
                 'confidence': 60,
-                'last_high': recent_highs[-1]['price'],
-                'last_low': recent_lows[-1]['price']
+                'last_high': last_high,
+                'last_low': last_low
             }
 
     def find_support_resistance_zones(
         self,
-        swing_points: List[Dict],
+        swing_points,
         zone_tolerance: float = 0.001
     ) -> List[Dict[str, Any]]:
         """
         Identify support/resistance zones from swing points.
 
-        Groups nearby swing points into zones.
+        Groups nearby swing points into zones. Points are clustered on
+        sorted price, so grouping does not depend on input order. First and
+        last touch follow the points' original order.
 
         Args:
-            swing_points: List of swing high or low points
+            swing_points: Swing high or low points (list of dicts or struct-of-arrays)
             zone_tolerance: Price tolerance for grouping (as decimal, e.g., 0.001 = 0.1%)
 
         Returns:
             List of support/resistance zones
         """
-        if not swing_points:
+        point_prices = self._point_prices(swing_points)
+        if not point_prices.size:
             return []
 
-        zones = []
-        used_points = set()
-
-        for i, point in enumerate(swing_points):
-            if i in used_points:
-                continue
-
-            price = point['price']
-            zone_points = [point]
-            used_points.add(i)
+        timestamps = self._point_timestamps(swing_points)
 
-            # Find nearby points
-            for j, other_point in enumerate(swing_points):
-                if j in used_points:
-                    continue
+        # Sort once, then sweep: a zone runs from its lowest price up to the
+        # last point within zone_tolerance of it (1-D density clustering)
+        order = np.argsort(point_prices, kind='stable')
+        sorted_prices = point_prices[order]
+        upper_bounds = sorted_prices * (1 + zone_tolerance)
 
-                other_price = other_point['price']
-                price_diff_pct = abs(other_price - price) / price
+        zones = []
+        lo = 0
+        n = sorted_prices.size
 
-                if price_diff_pct <= zone_tolerance:
-                    zone_points.append(other_point)
-                    used_points.add(j)
+        while lo < n:
+            hi = int(np.searchsorted(sorted_prices, upper_bounds[lo], side='right'))
 
             # Create zone if we have at least 2 touches
-            if len(zone_points) >= 2:
-                prices = [p['price'] for p in zone_points]
+            if hi - lo >= 2:
+                prices = sorted_prices[lo:hi]
+                members = order[lo:hi]
                 zones.append({
                     'price_level': float(np.mean(prices)),
-                    'price_high': float(max(prices)),
-                    'price_low': float(min(prices)),
-                    'touches': len(zone_points),
-                    'first_touch': zone_points[0]['timestamp'],
-                    'last_touch': zone_points[-1]['timestamp'],
-                    'strength': min(100, len(zone_points) * 25)  # Max 100
+                    'price_high': float(prices[-1]),
+                    'price_low': float(prices[0]),
+                    'touches': hi - lo,
+                    'first_touch': timestamps[members.min()],
+                    'last_touch': timestamps[members.max()],
+                    'strength': min(100, (hi - lo) * 25)  # Max 100
                 })
 
+            lo = hi
+
         # Sort by strength
         zones.sort(key=lambda x: x['strength'], reverse=True)
 
@@ -274,8 +404,8 @@ class PivotDetectionSkill:
         self,
         current_price: float,
         trend: str,
-        swing_highs: List[Dict],
-        swing_lows: List[Dict]
+        swing_highs,
+        swing_lows
     ) -> Dict[str, Any]:
         """
         Identify if price has broken market structure.
@@ -287,14 +417,17 @@ class PivotDetectionSkill:
         Args:
             current_price: Current market price
             trend: Current trend (uptrend, downtrend, ranging)
-            swing_highs: List of swing highs
-            swing_lows: List of swing lows
+            swing_highs: Swing highs (list of dicts or struct-of-arrays)
+            swing_lows: Swing lows (list of dicts or struct-of-arrays)
 
         Returns:
             Structure break analysis
         """
-        if trend == 'uptrend' and swing_lows:
-            last_higher_low = swing_lows[-1]['price']
+        high_prices = self._point_prices(swing_highs)
+        low_prices = self._point_prices(swing_lows)
+
+        if trend == 'uptrend' and low_prices.size:
+            last_higher_low = float(low_prices[-1])
             if current_price < last_higher_low:
                 return {
                     'structure_broken': True,
@@ -304,8 +437,8 @@ class PivotDetectionSkill:
                     'severity': abs(current_price - last_higher_low) / last_higher_low * 100
                 }
 
-        elif trend == 'downtrend' and swing_highs:
-            last_lower_high = swing_highs[-1]['price']
+        elif trend == 'downtrend' and high_prices.size:
+            last_lower_high = float(high_prices[-1])
             if current_price > last_lower_high:
                 return {
                     'structure_broken': True,
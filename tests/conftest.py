@@ -2,32 +2,98 @@
 Pytest configuration and shared fixtures
 """
 
+import copy
+import importlib
 import pytest
 import os
 import sys
+from types import MappingProxyType
+from unittest.mock import Mock, patch
 
 # Add project root to Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+from tests.helpers import AGENTS  # noqa: E402
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _stub_get_database():
+    """Keep LoggingAuditAgent off the real database for the whole session"""
+    with patch('agents.logging_audit.get_database', return_value=Mock()):
+        yield
+
+
+@pytest.fixture(scope="session")
+def agent_classes():
+    """Agent classes keyed by agent id, imported once on first use"""
+    return MappingProxyType({
+        agent_id: getattr(importlib.import_module(module), class_name)
+        for agent_id, module, class_name in AGENTS
+    })
+
+
+_FROZEN_TIME = '2024-01-01T14:30:00+00:00'
+
+# Baseline trading state for the agent tests; every container in it is empty
+_BASE_STATE = {
+    'session_id': 'test-session-001',
+    'phase': 'pre_market',
+    'start_time': _FROZEN_TIME,
+    'current_time': _FROZEN_TIME,
+    'account_balance': 100000.0,
+    'initial_balance': 100000.0,
+    'session_pnl': 0.0,
+    'session_pnl_pct': 0.0,
+    'risk_params': {},
+    'risk_utilization': 0.0,
+    'max_session_risk_pct': 3.0,
+    'risk_per_trade_pct': 1.0,
+    'market': 'crypto',
+    'instrument': 'ETH-USDT',
+    'market_structure': {},
+    'trend': {},
+    'strength_weakness': {},
+    'positions': [],
+    'open_positions_count': 0,
+    'pending_orders': [],
+    'trades_today': [],
+    'agent_outputs': {},
+    'alerts': [],
+    'system_health': {},
+    'emergency_stop': False,
+    'stop_reason': None
+}
+
 
 @pytest.fixture(scope="session")
-def test_config():
-    """Test configuration"""
-    return {
-        'anthropic_api_key': 'test-api-key',
-        'model': 'claude-sonnet-4-20250514',
-        'session_config': {
-            'market': 'crypto',
-            'instrument': 'ETH-USDT',
-            'session_start_time': '09:30:00',
-            'duration_hours': 3
-        },
-        'risk_config': {
-            'risk_per_trade_pct': 1.0,
-            'max_session_risk_pct': 3.0,
-            'max_positions': 3
-        },
-        'account_config': {
-            'initial_balance': 100000.0
-        }
-    }
+def _base_state_template():
+    """Read-only view of the baseline trading state"""
+    return MappingProxyType(_BASE_STATE)
+
+
+@pytest.fixture(scope="session")
+def make_trading_state(_base_state_template):
+    """Factory building a fresh trading state from the baseline plus overrides"""
+    def _make(overrides=None):
+        # The prototype only holds scalars and empty containers, so a one-level
+        # copy is enough to keep tests from sharing mutable state
+        state = {key: copy.copy(value) for key, value in _base_state_template.items()}
+        state.update(copy.deepcopy(overrides or {}))
+        return state
+
+    return _make
+
+
+@pytest.fixture
+def trading_state(make_trading_state, request):
+    """
+    Fresh trading state with overrides applied.
+
+    Overrides come from an indirect parametrize value, falling back to
+    the test class's state_overrides attribute.
+    """
+    overrides = getattr(request, 'param', None)
+    if overrides is None:
+        overrides = getattr(request.cls, 'state_overrides', {})
+
+    return make_trading_state(overrides)
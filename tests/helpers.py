@@ -0,0 +1,46 @@
+"""
+Shared test data for the agent tests
+"""
+
+from types import MappingProxyType
+
+
+# Read-only agent configuration shared by the whole test session
+TEST_CONFIG = MappingProxyType({
+    'anthropic_api_key': 'test-api-key',
+    'gateway_enabled': False,
+    'model': 'claude-sonnet-4-20250514',
+    'session_config': MappingProxyType({
+        'market': 'crypto',
+        'instrument': 'ETH-USDT',
+        'session_start_time': '09:30:00',
+        'duration_hours': 3
+    }),
+    'risk_config': MappingProxyType({
+        'risk_per_trade_pct': 1.0,
+        'max_session_risk_pct': 3.0,
+        'max_positions': 3
+    }),
+    'account_config': MappingProxyType({
+        'initial_balance': 100000.0
+    })
+})
+
+# (agent id, module, class name) for every agent covered by the initialization tests
+AGENTS = (
+    ('risk_mgmt', 'agents.risk_management', 'RiskManagementAgent'),
+    ('market_structure', 'agents.market_structure', 'MarketStructureAgent'),
+    ('system_init', 'agents.system_init', 'SystemInitAgent'),
+    ('monitoring', 'agents.monitoring', 'RealTimeMonitoringAgent'),
+    ('setup_scanner', 'agents.setup_scanner', 'SetupScannerAgent'),
+    ('entry_execution', 'agents.entry_execution', 'EntryExecutionAgent'),
+    ('exit_execution', 'agents.exit_execution', 'ExitExecutionAgent'),
+    ('trade_management', 'agents.trade_management', 'TradeManagementAgent'),
+    ('session_review', 'agents.session_review', 'SessionReviewAgent'),
+    ('performance_analytics', 'agents.performance_analytics', 'PerformanceAnalyticsAgent'),
+    ('learning_optimization', 'agents.learning_optimization', 'LearningOptimizationAgent'),
+    ('contingency', 'agents.contingency', 'ContingencyManagementAgent'),
+    ('strength_weakness', 'agents.strength_weakness', 'StrengthWeaknessAgent'),
+)
+
+AGENT_IDS = [agent_id for agent_id, _, _ in AGENTS]
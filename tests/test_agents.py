@@ -4,17 +4,16 @@ Comprehensive tests for all trading agents
 
 import pytest
 import asyncio
-from unittest.mock import Mock, AsyncMock, patch
+from unittest.mock import AsyncMock
 from datetime import datetime, timedelta, timezone
 
-from agents.base import TradingState
 from agents.system_init import SystemInitAgent
 from agents.risk_management import RiskManagementAgent
 from agents.market_structure import MarketStructureAgent
 from agents.economic_calendar import EconomicCalendarAgent
 from agents.trend_definition import TrendDefinitionAgent
 from agents.strength_weakness import StrengthWeaknessAgent
-from agents.monitoring import MonitoringAgent
+from agents.monitoring import RealTimeMonitoringAgent as MonitoringAgent
 from agents.setup_scanner import SetupScannerAgent
 from agents.entry_execution import EntryExecutionAgent
 from agents.trade_management import TradeManagementAgent
@@ -23,61 +22,135 @@ from agents.session_review import SessionReviewAgent
 from agents.performance_analytics import PerformanceAnalyticsAgent
 from agents.learning_optimization import LearningOptimizationAgent
 from agents.logging_audit import LoggingAuditAgent
-from agents.contingency import ContingencyAgent
+from agents.contingency import ContingencyManagementAgent as ContingencyAgent
+from tests.helpers import TEST_CONFIG
+
+
+# Session clock matching the frozen baseline state in conftest.py
+_NOW = datetime(2024, 1, 1, 14, 30, tzinfo=timezone.utc)
+_NOW_M1H_ISO = (_NOW - timedelta(hours=1)).isoformat()
+_NOW_M2H_ISO = (_NOW - timedelta(hours=2)).isoformat()
+
+RISK_STATE_OVERRIDES = {
+    'phase': 'active_trading',
+    'start_time': _NOW_M1H_ISO,
+    'session_pnl': 500.0,
+    'session_pnl_pct': 0.5
+}
+
+# (agent class, agent id, trading state overrides) for the execution smoke test
+AGENT_MATRIX = [
+    pytest.param(SystemInitAgent, 'system_init', {}, id='system_init'),
+    pytest.param(RiskManagementAgent, 'risk_mgmt', RISK_STATE_OVERRIDES, id='risk_mgmt'),
+    pytest.param(MarketStructureAgent, 'market_structure', {}, id='market_structure'),
+    pytest.param(EconomicCalendarAgent, 'economic_calendar', {}, id='economic_calendar'),
+    pytest.param(TrendDefinitionAgent, 'trend_definition', {
+        'phase': 'session_open',
+        'market_structure': {'support': 2000, 'resistance': 2500}
+    }, id='trend_definition'),
+    pytest.param(StrengthWeaknessAgent, 'strength_weakness', {
+        'phase': 'session_open',
+        'trend': {'direction': 'uptrend', 'strength': 'strong'}
+    }, id='strength_weakness'),
+    pytest.param(MonitoringAgent, 'monitoring', {'phase': 'active_trading'}, id='monitoring'),
+    pytest.param(SetupScannerAgent, 'setup_scanner', {
+        'phase': 'active_trading',
+        'trend': {'direction': 'uptrend'}
+    }, id='setup_scanner'),
+    pytest.param(EntryExecutionAgent, 'entry_execution', {
+        'phase': 'active_trading',
+        'agent_outputs': {'setup_scanner': {'setups_found': []}}
+    }, id='entry_execution'),
+    pytest.param(TradeManagementAgent, 'trade_management', {
+        'phase': 'active_trading',
+        'positions': [
+            {
+                'id': 'pos-001',
+                'instrument': 'ETH-USDT',
+                'type': 'long',
+                'entry_price': 2000.0,
+                'quantity': 1.0,
+                'current_price': 2050.0,
+                'pnl': 50.0
+            }
+        ],
+        'open_positions_count': 1
+    }, id='trade_management'),
+    pytest.param(ExitExecutionAgent, 'exit_execution', {'phase': 'active_trading'}, id='exit_execution'),
+    pytest.param(SessionReviewAgent, 'session_review', {
+        'phase': 'post_market',
+        'start_time': _NOW_M2H_ISO,
+        'account_balance': 101000.0,
+        'session_pnl': 1000.0,
+        'session_pnl_pct': 1.0,
+        'trades_today': [
+            {
+                'id': 'trade-001',
+                'entry_price': 2000.0,
+                'exit_price': 2050.0,
+                'pnl': 50.0,
+                'pnl_pct': 2.5
+            }
+        ]
+    }, id='session_review'),
+    pytest.param(PerformanceAnalyticsAgent, 'performance_analytics', {
+        'phase': 'post_market',
+        'account_balance': 101000.0,
+        'session_pnl': 1000.0,
+        'session_pnl_pct': 1.0
+    }, id='performance_analytics'),
+    pytest.param(LearningOptimizationAgent, 'learning_optimization', {'phase': 'post_market'},
+                 id='learning_optimization'),
+    pytest.param(ContingencyAgent, 'contingency', {'phase': 'active_trading'}, id='contingency'),
+]
+
+
+@pytest.mark.parametrize(
+    "agent_cls, agent_id, trading_state",
+    AGENT_MATRIX,
+    indirect=["trading_state"]
+)
+async def test_agent_execution(agent_cls, agent_id, trading_state):
+    """Test that each agent executes and records its output"""
+    agent = agent_cls(agent_id, TEST_CONFIG)
+    result = await agent.execute(trading_state)
+
+    assert result is not None
+    assert agent_id in result['agent_outputs']
+
+
+async def test_all_agents_execute_concurrently(make_trading_state):
+    """Test that every agent in the matrix can execute side by side on one loop"""
+    matrix = [param.values for param in AGENT_MATRIX]
+    agents = [agent_cls(agent_id, TEST_CONFIG) for agent_cls, agent_id, _ in matrix]
+
+    results = await asyncio.gather(*(
+        agent.execute(make_trading_state(overrides))
+        for agent, (_, _, overrides) in zip(agents, matrix)
+    ))
+
+    for (_, agent_id, _), result in zip(matrix, results):
+        assert agent_id in result['agent_outputs']
 
 
 class TestSystemInitAgent:
     """Tests for System Initialization Agent"""
 
-    @pytest.fixture
-    def agent(self, test_config):
-        return SystemInitAgent('system_init', test_config)
-
-    @pytest.fixture
-    def trading_state(self, test_config):
-        return {
-            'session_id': 'test-session-001',
-            'phase': 'pre_market',
-            'start_time': datetime.now(timezone.utc).isoformat(),
-            'current_time': datetime.now(timezone.utc).isoformat(),
-            'account_balance': 100000.0,
-            'initial_balance': 100000.0,
-            'session_pnl': 0.0,
-            'session_pnl_pct': 0.0,
-            'risk_params': {},
-            'risk_utilization': 0.0,
-            'max_session_risk_pct': 3.0,
-            'risk_per_trade_pct': 1.0,
-            'market': 'crypto',
-            'instrument': 'ETH-USDT',
-            'market_structure': {},
-            'trend': {},
-            'strength_weakness': {},
-            'positions': [],
-            'open_positions_count': 0,
-            'pending_orders': [],
-            'trades_today': [],
-            'agent_outputs': {},
-            'alerts': [],
-            'system_health': {},
-            'emergency_stop': False,
-            'stop_reason': None
-        }
-
-    @pytest.mark.asyncio
-    async def test_system_init_execution(self, agent, trading_state):
-        """Test system initialization agent execution"""
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def agent():
+        return SystemInitAgent('system_init', TEST_CONFIG)
+
+    async def test_system_init_keeps_phase(self, agent, trading_state):
+        """Test that system init leaves the session phase unchanged"""
         result = await agent.execute(trading_state)
-        
-        assert result is not None
-        assert 'system_init' in result.get('agent_outputs', {})
+
         assert result['phase'] == 'pre_market'
 
-    @pytest.mark.asyncio
     async def test_system_init_validates_state(self, agent, trading_state):
         """Test that system init validates trading state"""
         result = await agent.execute(trading_state)
-        
+
         output = result['agent_outputs'].get('system_init', {})
         assert output.get('status') in ['success', 'error', 'warning']
 
@@ -85,55 +158,17 @@ class TestSystemInitAgent:
 class TestRiskManagementAgent:
     """Tests for Risk Management Agent"""
 
-    @pytest.fixture
-    def agent(self, test_config):
-        return RiskManagementAgent('risk_mgmt', test_config)
-
-    @pytest.fixture
-    def trading_state(self, test_config):
-        state: TradingState = {
-            'session_id': 'test-session-001',
-            'phase': 'active_trading',
-            'start_time': (datetime.now(timezone.utc) - timedelta(hours=1)).isoformat(),
-            'current_time': datetime.now(timezone.utc).isoformat(),
-            'account_balance': 100000.0,
-            'initial_balance': 100000.0,
-            'session_pnl': 500.0,
-            'session_pnl_pct': 0.5,
-            'risk_params': {},
-            'risk_utilization': 0.0,
-            'max_session_risk_pct': 3.0,
-            'risk_per_trade_pct': 1.0,
-            'market': 'crypto',
-            'instrument': 'ETH-USDT',
-            'market_structure': {},
-            'trend': {},
-            'strength_weakness': {},
-            'positions': [],
-            'open_positions_count': 0,
-            'pending_orders': [],
-            'trades_today': [],
-            'agent_outputs': {},
-            'alerts': [],
-            'system_health': {},
-            'emergency_stop': False,
-            'stop_reason': None
-        }
-        return state
-
-    @pytest.mark.asyncio
-    async def test_risk_check_execution(self, agent, trading_state):
-        """Test risk management agent execution"""
-        result = await agent.execute(trading_state)
-        
-        assert result is not None
-        assert 'risk_mgmt' in result['agent_outputs']
+    state_overrides = RISK_STATE_OVERRIDES
+
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def agent():
+        return RiskManagementAgent('risk_mgmt', TEST_CONFIG)
 
-    @pytest.mark.asyncio
     async def test_risk_utilization_calculation(self, agent, trading_state):
         """Test that risk utilization is calculated"""
         result = await agent.execute(trading_state)
-        
+
         # Risk utilization should be between 0 and max_session_risk_pct
         assert 0 <= result.get('risk_utilization', 0) <= 100
 
@@ -141,704 +176,63 @@ class TestRiskManagementAgent:
 class TestMarketStructureAgent:
     """Tests for Market Structure Agent"""
 
-    @pytest.fixture
-    def agent(self, test_config):
-        return MarketStructureAgent('market_structure', test_config)
-
-    @pytest.fixture
-    def trading_state(self, test_config):
-        state: TradingState = {
-            'session_id': 'test-session-001',
-            'phase': 'pre_market',
-            'start_time': datetime.now(timezone.utc).isoformat(),
-            'current_time': datetime.now(timezone.utc).isoformat(),
-            'account_balance': 100000.0,
-            'initial_balance': 100000.0,
-            'session_pnl': 0.0,
-            'session_pnl_pct': 0.0,
-            'risk_params': {},
-            'risk_utilization': 0.0,
-            'max_session_risk_pct': 3.0,
-            'risk_per_trade_pct': 1.0,
-            'market': 'crypto',
-            'instrument': 'ETH-USDT',
-            'market_structure': {},
-            'trend': {},
-            'strength_weakness': {},
-            'positions': [],
-            'open_positions_count': 0,
-            'pending_orders': [],
-            'trades_today': [],
-            'agent_outputs': {},
-            'alerts': [],
-            'system_health': {},
-            'emergency_stop': False,
-            'stop_reason': None
-        }
-        return state
-
-    @pytest.mark.asyncio
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def agent():
+        return MarketStructureAgent('market_structure', TEST_CONFIG)
+
     async def test_market_structure_analysis(self, agent, trading_state):
         """Test market structure analysis"""
         result = await agent.execute(trading_state)
-        
-        assert result is not None
-        assert 'market_structure' in result['agent_outputs']
+
         assert result['market_structure'] is not None
 
 
 class TestEconomicCalendarAgent:
     """Tests for Economic Calendar Agent"""
 
-    @pytest.fixture
-    def agent(self, test_config):
-        return EconomicCalendarAgent('economic_calendar', test_config)
-
-    @pytest.fixture
-    def trading_state(self, test_config):
-        state: TradingState = {
-            'session_id': 'test-session-001',
-            'phase': 'pre_market',
-            'start_time': datetime.now(timezone.utc).isoformat(),
-            'current_time': datetime.now(timezone.utc).isoformat(),
-            'account_balance': 100000.0,
-            'initial_balance': 100000.0,
-            'session_pnl': 0.0,
-            'session_pnl_pct': 0.0,
-            'risk_params': {},
-            'risk_utilization': 0.0,
-            'max_session_risk_pct': 3.0,
-            'risk_per_trade_pct': 1.0,
-            'market': 'crypto',
-            'instrument': 'ETH-USDT',
-            'market_structure': {},
-            'trend': {},
-            'strength_weakness': {},
-            'positions': [],
-            'open_positions_count': 0,
-            'pending_orders': [],
-            'trades_today': [],
-            'agent_outputs': {},
-            'alerts': [],
-            'system_health': {},
-            'emergency_stop': False,
-            'stop_reason': None
-        }
-        return state
-
-    @pytest.mark.asyncio
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def agent():
+        return EconomicCalendarAgent('economic_calendar', TEST_CONFIG)
+
     async def test_economic_calendar_check(self, agent, trading_state):
         """Test economic calendar checking"""
         result = await agent.execute(trading_state)
-        
-        assert result is not None
-        assert 'economic_calendar' in result['agent_outputs']
+
         output = result['agent_outputs']['economic_calendar']
         assert 'trading_restricted' in output or output.get('status') in ['success', 'error']
 
-    @pytest.mark.asyncio
     async def test_crypto_no_events_fallback(self, agent, trading_state):
         """Test that crypto trading returns empty events"""
         result = await agent.execute(trading_state)
-        
+
         output = result['agent_outputs']['economic_calendar']
         # Crypto trading should have no events or empty list
         assert output.get('upcoming_events', []) == [] or 'status' in output
 
 
-class TestTrendDefinitionAgent:
-    """Tests for Trend Definition Agent"""
-
-    @pytest.fixture
-    def agent(self, test_config):
-        return TrendDefinitionAgent('trend_definition', test_config)
-
-    @pytest.fixture
-    def trading_state(self, test_config):
-        state: TradingState = {
-            'session_id': 'test-session-001',
-            'phase': 'session_open',
-            'start_time': datetime.now(timezone.utc).isoformat(),
-            'current_time': datetime.now(timezone.utc).isoformat(),
-            'account_balance': 100000.0,
-            'initial_balance': 100000.0,
-            'session_pnl': 0.0,
-            'session_pnl_pct': 0.0,
-            'risk_params': {},
-            'risk_utilization': 0.0,
-            'max_session_risk_pct': 3.0,
-            'risk_per_trade_pct': 1.0,
-            'market': 'crypto',
-            'instrument': 'ETH-USDT',
-            'market_structure': {'support': 2000, 'resistance': 2500},
-            'trend': {},
-            'strength_weakness': {},
-            'positions': [],
-            'open_positions_count': 0,
-            'pending_orders': [],
-            'trades_today': [],
-            'agent_outputs': {},
-            'alerts': [],
-            'system_health': {},
-            'emergency_stop': False,
-            'stop_reason': None
-        }
-        return state
-
-    @pytest.mark.asyncio
-    async def test_trend_definition_execution(self, agent, trading_state):
-        """Test trend definition agent"""
-        result = await agent.execute(trading_state)
-        
-        assert result is not None
-        assert 'trend_definition' in result['agent_outputs']
-
-
-class TestStrengthWeaknessAgent:
-    """Tests for Strength/Weakness Agent"""
-
-    @pytest.fixture
-    def agent(self, test_config):
-        return StrengthWeaknessAgent('strength_weakness', test_config)
-
-    @pytest.fixture
-    def trading_state(self, test_config):
-        state: TradingState = {
-            'session_id': 'test-session-001',
-            'phase': 'session_open',
-            'start_time': datetime.now(timezone.utc).isoformat(),
-            'current_time': datetime.now(timezone.utc).isoformat(),
-            'account_balance': 100000.0,
-            'initial_balance': 100000.0,
-            'session_pnl': 0.0,
-            'session_pnl_pct': 0.0,
-            'risk_params': {},
-            'risk_utilization': 0.0,
-            'max_session_risk_pct': 3.0,
-            'risk_per_trade_pct': 1.0,
-            'market': 'crypto',
-            'instrument': 'ETH-USDT',
-            'market_structure': {},
-            'trend': {'direction': 'uptrend', 'strength': 'strong'},
-            'strength_weakness': {},
-            'positions': [],
-            'open_positions_count': 0,
-            'pending_orders': [],
-            'trades_today': [],
-            'agent_outputs': {},
-            'alerts': [],
-            'system_health': {},
-            'emergency_stop': False,
-            'stop_reason': None
-        }
-        return state
-
-    @pytest.mark.asyncio
-    async def test_strength_weakness_analysis(self, agent, trading_state):
-        """Test strength/weakness analysis"""
-        result = await agent.execute(trading_state)
-        
-        assert result is not None
-        assert 'strength_weakness' in result['agent_outputs']
-
-
-class TestMonitoringAgent:
-    """Tests for Monitoring Agent"""
-
-    @pytest.fixture
-    def agent(self, test_config):
-        return MonitoringAgent('monitoring', test_config)
-
-    @pytest.fixture
-    def trading_state(self, test_config):
-        state: TradingState = {
-            'session_id': 'test-session-001',
-            'phase': 'active_trading',
-            'start_time': datetime.now(timezone.utc).isoformat(),
-            'current_time': datetime.now(timezone.utc).isoformat(),
-            'account_balance': 100000.0,
-            'initial_balance': 100000.0,
-            'session_pnl': 0.0,
-            'session_pnl_pct': 0.0,
-            'risk_params': {},
-            'risk_utilization': 0.0,
-            'max_session_risk_pct': 3.0,
-            'risk_per_trade_pct': 1.0,
-            'market': 'crypto',
-            'instrument': 'ETH-USDT',
-            'market_structure': {},
-            'trend': {},
-            'strength_weakness': {},
-            'positions': [],
-            'open_positions_count': 0,
-            'pending_orders': [],
-            'trades_today': [],
-            'agent_outputs': {},
-            'alerts': [],
-            'system_health': {},
-            'emergency_stop': False,
-            'stop_reason': None
-        }
-        return state
-
-    @pytest.mark.asyncio
-    async def test_monitoring_execution(self, agent, trading_state):
-        """Test monitoring agent"""
-        result = await agent.execute(trading_state)
-        
-        assert result is not None
-        assert 'monitoring' in result['agent_outputs']
-
-
-class TestSetupScannerAgent:
-    """Tests for Setup Scanner Agent"""
-
-    @pytest.fixture
-    def agent(self, test_config):
-        return SetupScannerAgent('setup_scanner', test_config)
-
-    @pytest.fixture
-    def trading_state(self, test_config):
-        state: TradingState = {
-            'session_id': 'test-session-001',
-            'phase': 'active_trading',
-            'start_time': datetime.now(timezone.utc).isoformat(),
-            'current_time': datetime.now(timezone.utc).isoformat(),
-            'account_balance': 100000.0,
-            'initial_balance': 100000.0,
-            'session_pnl': 0.0,
-            'session_pnl_pct': 0.0,
-            'risk_params': {},
-            'risk_utilization': 0.0,
-            'max_session_risk_pct': 3.0,
-            'risk_per_trade_pct': 1.0,
-            'market': 'crypto',
-            'instrument': 'ETH-USDT',
-            'market_structure': {},
-            'trend': {'direction': 'uptrend'},
-            'strength_weakness': {},
-            'positions': [],
-            'open_positions_count': 0,
-            'pending_orders': [],
-            'trades_today': [],
-            'agent_outputs': {},
-            'alerts': [],
-            'system_health': {},
-            'emergency_stop': False,
-            'stop_reason': None
-        }
-        return state
-
-    @pytest.mark.asyncio
-    async def test_setup_scanner_execution(self, agent, trading_state):
-        """Test setup scanner agent"""
-        result = await agent.execute(trading_state)
-        
-        assert result is not None
-        assert 'setup_scanner' in result['agent_outputs']
-
-
-class TestEntryExecutionAgent:
-    """Tests for Entry Execution Agent"""
-
-    @pytest.fixture
-    def agent(self, test_config):
-        return EntryExecutionAgent('entry_execution', test_config)
-
-    @pytest.fixture
-    def trading_state(self, test_config):
-        state: TradingState = {
-            'session_id': 'test-session-001',
-            'phase': 'active_trading',
-            'start_time': datetime.now(timezone.utc).isoformat(),
-            'current_time': datetime.now(timezone.utc).isoformat(),
-            'account_balance': 100000.0,
-            'initial_balance': 100000.0,
-            'session_pnl': 0.0,
-            'session_pnl_pct': 0.0,
-            'risk_params': {},
-            'risk_utilization': 0.0,
-            'max_session_risk_pct': 3.0,
-            'risk_per_trade_pct': 1.0,
-            'market': 'crypto',
-            'instrument': 'ETH-USDT',
-            'market_structure': {},
-            'trend': {},
-            'strength_weakness': {},
-            'positions': [],
-            'open_positions_count': 0,
-            'pending_orders': [],
-            'trades_today': [],
-            'agent_outputs': {'setup_scanner': {'setups_found': []}},
-            'alerts': [],
-            'system_health': {},
-            'emergency_stop': False,
-            'stop_reason': None
-        }
-        return state
-
-    @pytest.mark.asyncio
-    async def test_entry_execution_execution(self, agent, trading_state):
-        """Test entry execution agent"""
-        result = await agent.execute(trading_state)
-        
-        assert result is not None
-        assert 'entry_execution' in result['agent_outputs']
-
-
-class TestTradeManagementAgent:
-    """Tests for Trade Management Agent"""
-
-    @pytest.fixture
-    def agent(self, test_config):
-        return TradeManagementAgent('trade_management', test_config)
-
-    @pytest.fixture
-    def trading_state(self, test_config):
-        state: TradingState = {
-            'session_id': 'test-session-001',
-            'phase': 'active_trading',
-            'start_time': datetime.now(timezone.utc).isoformat(),
-            'current_time': datetime.now(timezone.utc).isoformat(),
-            'account_balance': 100000.0,
-            'initial_balance': 100000.0,
-            'session_pnl': 0.0,
-            'session_pnl_pct': 0.0,
-            'risk_params': {},
-            'risk_utilization': 0.0,
-            'max_session_risk_pct': 3.0,
-            'risk_per_trade_pct': 1.0,
-            'market': 'crypto',
-            'instrument': 'ETH-USDT',
-            'market_structure': {},
-            'trend': {},
-            'strength_weakness': {},
-            'positions': [
-                {
-                    'id': 'pos-001',
-                    'instrument': 'ETH-USDT',
-                    'type': 'long',
-                    'entry_price': 2000.0,
-                    'quantity': 1.0,
-                    'current_price': 2050.0,
-                    'pnl': 50.0
-                }
-            ],
-            'open_positions_count': 1,
-            'pending_orders': [],
-            'trades_today': [],
-            'agent_outputs': {},
-            'alerts': [],
-            'system_health': {},
-            'emergency_stop': False,
-            'stop_reason': None
-        }
-        return state
-
-    @pytest.mark.asyncio
-    async def test_trade_management_execution(self, agent, trading_state):
-        """Test trade management agent"""
-        result = await agent.execute(trading_state)
-        
-        assert result is not None
-        assert 'trade_management' in result['agent_outputs']
-
-
-class TestExitExecutionAgent:
-    """Tests for Exit Execution Agent"""
-
-    @pytest.fixture
-    def agent(self, test_config):
-        return ExitExecutionAgent('exit_execution', test_config)
-
-    @pytest.fixture
-    def trading_state(self, test_config):
-        state: TradingState = {
-            'session_id': 'test-session-001',
-            'phase': 'active_trading',
-            'start_time': datetime.now(timezone.utc).isoformat(),
-            'current_time': datetime.now(timezone.utc).isoformat(),
-            'account_balance': 100000.0,
-            'initial_balance': 100000.0,
-            'session_pnl': 0.0,
-            'session_pnl_pct': 0.0,
-            'risk_params': {},
-            'risk_utilization': 0.0,
-            'max_session_risk_pct': 3.0,
-            'risk_per_trade_pct': 1.0,
-            'market': 'crypto',
-            'instrument': 'ETH-USDT',
-            'market_structure': {},
-            'trend': {},
-            'strength_weakness': {},
-            'positions': [],
-            'open_positions_count': 0,
-            'pending_orders': [],
-            'trades_today': [],
-            'agent_outputs': {},
-            'alerts': [],
-            'system_health': {},
-            'emergency_stop': False,
-            'stop_reason': None
-        }
-        return state
-
-    @pytest.mark.asyncio
-    async def test_exit_execution_execution(self, agent, trading_state):
-        """Test exit execution agent"""
-        result = await agent.execute(trading_state)
-        
-        assert result is not None
-        assert 'exit_execution' in result['agent_outputs']
-
-
-class TestSessionReviewAgent:
-    """Tests for Session Review Agent"""
-
-    @pytest.fixture
-    def agent(self, test_config):
-        return SessionReviewAgent('session_review', test_config)
-
-    @pytest.fixture
-    def trading_state(self, test_config):
-        state: TradingState = {
-            'session_id': 'test-session-001',
-            'phase': 'post_market',
-            'start_time': (datetime.now(timezone.utc) - timedelta(hours=2)).isoformat(),
-            'current_time': datetime.now(timezone.utc).isoformat(),
-            'account_balance': 101000.0,
-            'initial_balance': 100000.0,
-            'session_pnl': 1000.0,
-            'session_pnl_pct': 1.0,
-            'risk_params': {},
-            'risk_utilization': 0.0,
-            'max_session_risk_pct': 3.0,
-            'risk_per_trade_pct': 1.0,
-            'market': 'crypto',
-            'instrument': 'ETH-USDT',
-            'market_structure': {},
-            'trend': {},
-            'strength_weakness': {},
-            'positions': [],
-            'open_positions_count': 0,
-            'pending_orders': [],
-            'trades_today': [
-                {
-                    'id': 'trade-001',
-                    'entry_price': 2000.0,
-                    'exit_price': 2050.0,
-                    'pnl': 50.0,
-                    'pnl_pct': 2.5
-                }
-            ],
-            'agent_outputs': {},
-            'alerts': [],
-            'system_health': {},
-            'emergency_stop': False,
-            'stop_reason': None
-        }
-        return state
-
-    @pytest.mark.asyncio
-    async def test_session_review_execution(self, agent, trading_state):
-        """Test session review agent"""
-        result = await agent.execute(trading_state)
-        
-        assert result is not None
-        assert 'session_review' in result['agent_outputs']
-
-
-class TestPerformanceAnalyticsAgent:
-    """Tests for Performance Analytics Agent"""
-
-    @pytest.fixture
-    def agent(self, test_config):
-        return PerformanceAnalyticsAgent('performance_analytics', test_config)
-
-    @pytest.fixture
-    def trading_state(self, test_config):
-        state: TradingState = {
-            'session_id': 'test-session-001',
-            'phase': 'post_market',
-            'start_time': datetime.now(timezone.utc).isoformat(),
-            'current_time': datetime.now(timezone.utc).isoformat(),
-            'account_balance': 101000.0,
-            'initial_balance': 100000.0,
-            'session_pnl': 1000.0,
-            'session_pnl_pct': 1.0,
-            'risk_params': {},
-            'risk_utilization': 0.0,
-            'max_session_risk_pct': 3.0,
-            'risk_per_trade_pct': 1.0,
-            'market': 'crypto',
-            'instrument': 'ETH-USDT',
-            'market_structure': {},
-            'trend': {},
-            'strength_weakness': {},
-            'positions': [],
-            'open_positions_count': 0,
-            'pending_orders': [],
-            'trades_today': [],
-            'agent_outputs': {},
-            'alerts': [],
-            'system_health': {},
-            'emergency_stop': False,
-            'stop_reason': None
-        }
-        return state
-
-    @pytest.mark.asyncio
-    async def test_performance_analytics_execution(self, agent, trading_state):
-        """Test performance analytics agent"""
-        result = await agent.execute(trading_state)
-        
-        assert result is not None
-        assert 'performance_analytics' in result['agent_outputs']
-
-
-class TestLearningOptimizationAgent:
-    """Tests for Learning Optimization Agent"""
-
-    @pytest.fixture
-    def agent(self, test_config):
-        return LearningOptimizationAgent('learning_optimization', test_config)
-
-    @pytest.fixture
-    def trading_state(self, test_config):
-        state: TradingState = {
-            'session_id': 'test-session-001',
-            'phase': 'post_market',
-            'start_time': datetime.now(timezone.utc).isoformat(),
-            'current_time': datetime.now(timezone.utc).isoformat(),
-            'account_balance': 100000.0,
-            'initial_balance': 100000.0,
-            'session_pnl': 0.0,
-            'session_pnl_pct': 0.0,
-            'risk_params': {},
-            'risk_utilization': 0.0,
-            'max_session_risk_pct': 3.0,
-            'risk_per_trade_pct': 1.0,
-            'market': 'crypto',
-            'instrument': 'ETH-USDT',
-            'market_structure': {},
-            'trend': {},
-            'strength_weakness': {},
-            'positions': [],
-            'open_positions_count': 0,
-            'pending_orders': [],
-            'trades_today': [],
-            'agent_outputs': {},
-            'alerts': [],
-            'system_health': {},
-            'emergency_stop': False,
-            'stop_reason': None
-        }
-        return state
-
-    @pytest.mark.asyncio
-    async def test_learning_optimization_execution(self, agent, trading_state):
-        """Test learning optimization agent"""
-        result = await agent.execute(trading_state)
-        
-        assert result is not None
-        assert 'learning_optimization' in result['agent_outputs']
-
-
 class TestLoggingAuditAgent:
     """Tests for Logging & Audit Agent"""
 
-    @pytest.fixture
-    def agent(self, test_config):
-        with patch('agents.logging_audit.get_database'):
-            return LoggingAuditAgent('logging_audit', test_config)
-
-    @pytest.fixture
-    def trading_state(self, test_config):
-        state: TradingState = {
-            'session_id': 'test-session-001',
-            'phase': 'active_trading',
-            'start_time': datetime.now(timezone.utc).isoformat(),
-            'current_time': datetime.now(timezone.utc).isoformat(),
-            'account_balance': 100000.0,
-            'initial_balance': 100000.0,
-            'session_pnl': 0.0,
-            'session_pnl_pct': 0.0,
-            'risk_params': {},
-            'risk_utilization': 0.0,
-            'max_session_risk_pct': 3.0,
-            'risk_per_trade_pct': 1.0,
-            'market': 'crypto',
-            'instrument': 'ETH-USDT',
-            'market_structure': {},
-            'trend': {},
-            'strength_weakness': {},
-            'positions': [],
-            'open_positions_count': 0,
-            'pending_orders': [],
-            'trades_today': [],
-            'agent_outputs': {'risk_mgmt': {'status': 'success'}},
-            'alerts': [],
-            'system_health': {},
-            'emergency_stop': False,
-            'stop_reason': None,
-            'active_trades': []
-        }
-        return state
-
-    @pytest.mark.asyncio
+    state_overrides = {
+        'phase': 'active_trading',
+        'agent_outputs': {'risk_mgmt': {'status': 'success'}},
+        'active_trades': []
+    }
+
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def agent():
+        # The instance belongs to this class only, so nothing needs restoring
+        agent = LoggingAuditAgent('logging_audit', TEST_CONFIG)
+        agent._ensure_session_exists = AsyncMock()
+        agent._log_agent_decisions = AsyncMock(return_value=1)
+        agent._log_trade_events = AsyncMock(return_value=[])
+        return agent
+
     async def test_logging_audit_execution(self, agent, trading_state):
         """Test logging & audit agent"""
-        with patch.object(agent, '_ensure_session_exists'), \
-             patch.object(agent, '_log_agent_decisions', return_value=1), \
-             patch.object(agent, '_log_trade_events', return_value=[]):
-            result = await agent.execute(trading_state)
-        
-        assert result is not None
-
-
-class TestContingencyAgent:
-    """Tests for Contingency Agent"""
-
-    @pytest.fixture
-    def agent(self, test_config):
-        return ContingencyAgent('contingency', test_config)
-
-    @pytest.fixture
-    def trading_state(self, test_config):
-        state: TradingState = {
-            'session_id': 'test-session-001',
-            'phase': 'active_trading',
-            'start_time': datetime.now(timezone.utc).isoformat(),
-            'current_time': datetime.now(timezone.utc).isoformat(),
-            'account_balance': 100000.0,
-            'initial_balance': 100000.0,
-            'session_pnl': 0.0,
-            'session_pnl_pct': 0.0,
-            'risk_params': {},
-            'risk_utilization': 0.0,
-            'max_session_risk_pct': 3.0,
-            'risk_per_trade_pct': 1.0,
-            'market': 'crypto',
-            'instrument': 'ETH-USDT',
-            'market_structure': {},
-            'trend': {},
-            'strength_weakness': {},
-            'positions': [],
-            'open_positions_count': 0,
-            'pending_orders': [],
-            'trades_today': [],
-            'agent_outputs': {},
-            'alerts': [],
-            'system_health': {},
-            'emergency_stop': False,
-            'stop_reason': None
-        }
-        return state
-
-    @pytest.mark.asyncio
-    async def test_contingency_execution(self, agent, trading_state):
-        """Test contingency agent"""
         result = await agent.execute(trading_state)
-        
+
         assert result is not None
-        assert 'contingency' in result['agent_outputs']
@@ -0,0 +1,432 @@
+"""
+Unit tests for the Hummingbot Gateway API client
+"""
+
+import asyncio
+import pytest
+from types import SimpleNamespace
+from aiohttp import web
+from structlog.testing import capture_logs
+from tools.gateway_api_client import GatewayHTTPError, HummingbotGatewayClient, _rows
+
+
+PORTFOLIO_STATE = {
+    'default': {
+        'binance': [
+            {'token': 'ETH', 'available_units': 1.5},
+            {'token': 'USDT', 'available_units': 100}
+        ]
+    }
+}
+
+
+def json_route(payload, status=200):
+    """Handler answering every request with a fixed JSON payload"""
+    async def handler(request):
+        return web.json_response(payload, status=status)
+    return handler
+
+
+def gated_route(payload, gate, status=200):
+    """Handler that holds every request until gate is set"""
+    async def handler(request):
+        await gate.wait()
+        return web.json_response(payload, status=status)
+    return handler
+
+
+async def wait_for_calls(gateway, count):
+    """Yield to the loop until the fake Gateway has seen count requests"""
+    while len(gateway.calls) < count:
+        await asyncio.sleep(0.001)
+
+
+@pytest.fixture
+async def gateway():
+    """Fake Gateway on a free local port plus a client pointed at it"""
+    routes = {}
+    calls = []
+
+    async def dispatch(request):
+        calls.append((request.method, request.path, await request.read()))
+        handler = routes.get(request.path)
+        if handler is None:
+            return web.Response(status=404, text='not found')
+        return await handler(request)
+
+    app = web.Application()
+    app.router.add_route('*', '/{tail:.*}', dispatch)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = runner.addresses[0][1]
+
+    client = HummingbotGatewayClient(f'http://127.0.0.1:{port}')
+    yield SimpleNamespace(client=client, routes=routes, calls=calls)
+
+    await client.close()
+    await runner.cleanup()
+
+
+class TestReadCache:
+    """Test the TTL cache for read endpoints"""
+
+    async def test_cached_balance_is_fetched_once(self, gateway):
+        """Test that a repeated balance lookup is served from the cache"""
+        gateway.routes['/portfolio/state'] = json_route(PORTFOLIO_STATE)
+
+        first = await gateway.client.get_balance('binance')
+        second = await gateway.client.get_balance('binance')
+
+        assert first == second
+        assert first['balance'] == 101.5
+        assert len(gateway.calls) == 1
+
+    async def test_mutating_cached_result_does_not_corrupt_cache(self, gateway):
+        """Test that changing a returned balance leaves the next lookup intact"""
+        gateway.routes['/portfolio/state'] = json_route(PORTFOLIO_STATE)
+
+        first = await gateway.client.get_balance('binance')
+        first['details'][0] = 'changed'
+        first['details'].clear()
+        second = await gateway.client.get_balance('binance')
+        second['details'].append('changed')
+        third = await gateway.client.get_balance('binance')
+
+        assert third['status'] == 'ok'
+        assert third['balance'] == 101.5
+        assert third['details'] == PORTFOLIO_STATE['default']['binance']
+        assert len(gateway.calls) == 1
+
+    async def test_order_keeps_connector_list_cached(self, gateway):
+        """Test that placing an order drops cached balances but not the connector list"""
+        gateway.routes['/portfolio/state'] = json_route(PORTFOLIO_STATE)
+        gateway.routes['/connectors/'] = json_route(['binance'])
+        gateway.routes['/trading/orders'] = json_route({'order_id': 'o1'})
+
+        await gateway.client.get_balance('binance')
+        await gateway.client.check_connector_status('binance')
+        await gateway.client.place_order('binance', 'ETH-USDT', 'buy', 1)
+        await gateway.client.get_balance('binance')
+        await gateway.client.check_connector_status('binance')
+
+        paths = [path for _, path, _ in gateway.calls]
+        assert paths.count('/portfolio/state') == 2
+        assert paths.count('/connectors/') == 1
+
+
+class TestInFlightRequests:
+    """Test that identical concurrent reads share one request"""
+
+    async def test_identical_reads_share_one_request(self, gateway):
+        """Test that concurrent identical reads send one request and get separate copies"""
+        gate = asyncio.Event()
+        gateway.routes['/market-data/order-book'] = gated_route({'bids': [[1, 2]], 'asks': []}, gate)
+
+        tasks = [
+            asyncio.ensure_future(gateway.client.get_order_book('binance', 'ETH-USDT'))
+            for _ in range(3)
+        ]
+        await wait_for_calls(gateway, 1)
+        gate.set()
+        results = await asyncio.gather(*tasks)
+
+        assert len(gateway.calls) == 1
+        assert all(r == results[0] for r in results)
+        results[0]['order_book']['bids'].clear()
+        assert results[1]['order_book']['bids'] == [[1, 2]]
+        assert results[1]['order_book'] is not results[2]['order_book']
+
+    async def test_different_reads_are_not_merged(self, gateway):
+        """Test that reads with different bodies each send their own request"""
+        gateway.routes['/market-data/order-book'] = json_route({'bids': [], 'asks': []})
+
+        await asyncio.gather(
+            gateway.client.get_order_book('binance', 'ETH-USDT'),
+            gateway.client.get_order_book('binance', 'BTC-USDT')
+        )
+
+        assert len(gateway.calls) == 2
+
+    async def test_cancelled_caller_does_not_cancel_others(self, gateway):
+        """Test that cancelling one waiter leaves the shared request running"""
+        gate = asyncio.Event()
+        gateway.routes['/trading/orders/active'] = gated_route({'orders': [{'id': 1}]}, gate)
+
+        first = asyncio.ensure_future(gateway.client._request('POST', '/trading/orders/active', data={}))
+        second = asyncio.ensure_future(gateway.client._request('POST', '/trading/orders/active', data={}))
+        await wait_for_calls(gateway, 1)
+        first.cancel()
+        gate.set()
+
+        assert await second == {'orders': [{'id': 1}]}
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        assert len(gateway.calls) == 1
+        assert gateway.client._inflight == {}
+
+    async def test_error_reaches_every_caller(self, gateway):
+        """Test that a failed shared request raises in every waiter"""
+        gate = asyncio.Event()
+        gateway.routes['/trading/orders/active'] = gated_route({'error': 'bad'}, gate, status=400)
+
+        tasks = [
+            asyncio.ensure_future(gateway.client._request('POST', '/trading/orders/active', data={}))
+            for _ in range(2)
+        ]
+        await wait_for_calls(gateway, 1)
+        gate.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert all(isinstance(r, GatewayHTTPError) and r.status == 400 for r in results)
+        assert len(gateway.calls) == 1
+        assert gateway.client._inflight == {}
+
+
+class TestRequestLogging:
+    """Test per-request logging"""
+
+    async def test_every_request_logged_at_debug(self, gateway):
+        """Test that each request emits a DEBUG event under the active config"""
+        gateway.routes['/trading/orders/active'] = json_route({'orders': []})
+
+        with capture_logs() as logs:
+            for _ in range(3):
+                await gateway.client.get_open_orders('binance')
+
+        events = [(log['event'], log['log_level']) for log in logs]
+        assert events.count(('gateway_api_request', 'debug')) == 3
+
+    async def test_one_in_n_requests_sampled_at_info(self, gateway):
+        """Test that the INFO sample follows the sample rate"""
+        gateway.routes['/trading/orders/active'] = json_route({'orders': []})
+        gateway.client._sample_n = 2
+
+        with capture_logs() as logs:
+            for _ in range(4):
+                await gateway.client.get_open_orders('binance')
+
+        events = [(log['event'], log['log_level']) for log in logs]
+        assert events.count(('gateway_api_request_sample', 'info')) == 2
+
+
+class TestClosePosition:
+    """Test closing positions"""
+
+    @pytest.fixture
+    def position_routes(self, gateway):
+        """Short ETH position of 2 plus an order endpoint echoing the payload"""
+        async def place(request):
+            return web.json_response({'order_id': 'o1', 'echo': await request.json()})
+
+        gateway.routes['/trading/positions'] = json_route({'rows': [{'trading_pair': 'ETH-USDT', 'amount': -2}]})
+        gateway.routes['/trading/orders'] = place
+        return gateway
+
+    async def test_close_all_fetches_fresh_position(self, position_routes):
+        """Test that closing the whole position ignores a recent snapshot"""
+        client = position_routes.client
+        await client.get_positions('binance', 'ETH-USDT')
+
+        result = await client.close_position('binance', 'ETH-USDT')
+
+        paths = [path for _, path, _ in position_routes.calls]
+        assert paths == ['/trading/positions', '/trading/positions', '/trading/orders']
+        assert result['order']['echo']['trade_type'] == 'BUY'
+        assert result['order']['echo']['amount'] == 2
+
+    async def test_partial_close_reuses_recent_snapshot(self, position_routes):
+        """Test that an explicit amount reuses a recent snapshot for the side"""
+        client = position_routes.client
+        await client.get_positions('binance', 'ETH-USDT')
+
+        result = await client.close_position('binance', 'ETH-USDT', amount=1)
+
+        paths = [path for _, path, _ in position_routes.calls]
+        assert paths == ['/trading/positions', '/trading/orders']
+        assert result['order']['echo']['trade_type'] == 'BUY'
+        assert result['order']['echo']['amount'] == 1
+
+
+TRADE_SHAPES = [
+    pytest.param([{'id': 1}, {'id': 2}], id='bare_list'),
+    pytest.param({'rows': [{'id': 1}]}, id='rows'),
+    pytest.param({'trades': [{'id': 9}], 'count': 1}, id='alt_key'),
+    pytest.param({'trades': [{'id': 9}], 'rows': [{'id': 1}]}, id='alt_key_before_rows'),
+    pytest.param({'rows': [{'id': 1}], 'trades': [{'id': 9}]}, id='rows_before_alt_key'),
+    pytest.param({'rows': [1, 2.5, 'x', None]}, id='scalar_rows'),
+    pytest.param({'rows': [{'id': 1, 'fills': [{'qty': 1}], 'meta': {'tags': ['a']}}, [3, [4]]]}, id='nested_rows'),
+    pytest.param({'count': 0}, id='no_rows'),
+    pytest.param({'trades': [], 'rows': []}, id='empty_rows'),
+]
+
+
+class TestStreamingRows:
+    """Test that streamed rows match the buffered _rows extraction"""
+
+    @pytest.mark.parametrize("payload", TRADE_SHAPES)
+    async def test_stream_matches_buffered(self, gateway, payload):
+        """Test that _request_stream yields exactly what _rows extracts"""
+        pytest.importorskip('ijson')
+        gateway.routes['/trading/trades'] = json_route(payload)
+
+        streamed = [
+            row async for row in
+            gateway.client._request_stream('POST', '/trading/trades', data={}, alt_key='trades')
+        ]
+        buffered = _rows(await gateway.client._request('POST', '/trading/trades', data={}), 'trades')
+
+        assert streamed == buffered
+
+    async def test_large_trade_history_is_streamed(self, gateway, monkeypatch):
+        """Test that get_trades above the threshold goes through the stream"""
+        pytest.importorskip('ijson')
+        monkeypatch.setattr('tools.gateway_api_client.STREAM_TRADES_THRESHOLD', 1)
+        gateway.routes['/trading/trades'] = json_route({'trades': [{'id': 9}], 'rows': [{'id': 1}]})
+
+        result = await gateway.client.get_trades(limit=5)
+
+        assert result['trades'] == [{'id': 1}]
+        assert result['count'] == 1
+
+
+class TestNameNormalization:
+    """Test that connector and pair spellings are normalized at every entry point"""
+
+    async def test_batch_prices_reuse_normalized_cache(self, gateway):
+        """Test that a batch lookup with raw spellings hits the price cache"""
+        gateway.routes['/market-data/prices'] = json_route({'prices': {'ETH-USDT': 100.5}, 'timestamp': 1})
+
+        await gateway.client.get_market_data('binance', 'ETH-USDT')
+        prices = await gateway.client.get_market_data_batch('Binance', ['eth-usdt'])
+
+        assert prices == {'eth-usdt': 100.5}
+        assert len(gateway.calls) == 1
+
+    async def test_request_bodies_use_normalized_names(self, gateway):
+        """Test that order book and open order filters send canonical names"""
+        gateway.routes['/market-data/order-book'] = json_route({'bids': [], 'asks': []})
+        gateway.routes['/trading/orders/active'] = json_route({'orders': []})
+
+        book = await gateway.client.get_order_book('Binance', 'eth-usdt')
+        await gateway.client.get_open_orders('Binance', 'eth-usdt')
+
+        assert (book['connector'], book['trading_pair']) == ('binance', 'ETH-USDT')
+        bodies = [body for _, _, body in gateway.calls]
+        assert b'"connector_name":"binance"' in bodies[0]
+        assert b'"connector_names":["binance"]' in bodies[1]
+        assert all(b'ETH-USDT' in body and b'eth-usdt' not in body for body in bodies)
+
+    async def test_name_memos_are_bounded(self, gateway):
+        """Test that caller-supplied spellings do not accumulate without limit"""
+        client = gateway.client
+        for i in range(2000):
+            client._norm_pair(f'pair-{i}')
+            client._norm_connector(f'connector-{i}')
+
+        assert client._norm_pair.cache_info().currsize <= 1024
+        assert client._norm_connector.cache_info().currsize <= 256
+
+
+class TestConnectorStatus:
+    """Test connector availability checks"""
+
+    async def test_connector_list_of_names(self, gateway):
+        """Test that a plain list of names is matched after normalization"""
+        gateway.routes['/connectors/'] = json_route(['binance', 'oanda'])
+
+        status = await gateway.client.check_connector_status('Binance')
+        missing = await gateway.client.check_connector_status('kraken')
+
+        assert status['available'] is True
+        assert missing['available'] is False
+        assert len(gateway.calls) == 1
+
+    async def test_connector_list_with_objects(self, gateway):
+        """Test that object entries in the list do not break the lookup"""
+        gateway.routes['/connectors/'] = json_route({'connectors': [{'name': 'kraken'}, 'binance']})
+
+        status = await gateway.client.check_connector_status('binance')
+        missing = await gateway.client.check_connector_status('kraken')
+
+        assert status['available'] is True
+        assert 'error' not in status
+        assert missing['available'] is False
+        assert status['all_connectors'] == [{'name': 'kraken'}, 'binance']
+
+
+class TestPlaceOrderValidation:
+    """Test that invalid orders are rejected before reaching the Gateway"""
+
+    @pytest.mark.parametrize("amount, order_type, price, message", [
+        pytest.param(0, 'market', None, 'must be positive', id='zero_amount'),
+        pytest.param(-1, 'market', None, 'must be positive', id='negative_amount'),
+        pytest.param(float('nan'), 'market', None, 'must be positive', id='nan_amount'),
+        pytest.param('abc', 'market', None, 'must be a number', id='string_amount'),
+        pytest.param(None, 'market', None, 'must be a number', id='missing_amount'),
+        pytest.param(1, 'limit', None, 'requires a positive price', id='limit_without_price'),
+        pytest.param(1, 'limit', 'abc', 'price must be a number', id='string_price'),
+        pytest.param(1, 'limit', -5, 'requires a positive price', id='negative_price'),
+    ])
+    async def test_invalid_order_returns_error(self, gateway, amount, order_type, price, message):
+        """Test that an invalid order returns an error status without a request"""
+        result = await gateway.client.place_order(
+            'binance', 'ETH-USDT', 'buy', amount, order_type=order_type, price=price
+        )
+
+        assert result['status'] == 'error'
+        assert message in result['error']
+        assert gateway.calls == []
+
+    async def test_numeric_strings_are_accepted(self, gateway):
+        """Test that numeric strings are sent to the Gateway as numbers"""
+        async def place(request):
+            return web.json_response({'order_id': 'o1', 'echo': await request.json()})
+        gateway.routes['/trading/orders'] = place
+
+        result = await gateway.client.place_order('binance', 'ETH-USDT', 'buy', '1.5', order_type='limit', price='2000')
+
+        assert result['status'] == 'executed'
+        assert result['order']['echo']['amount'] == 1.5
+        assert result['order']['echo']['price'] == 2000
+        assert result['order']['echo']['order_type'] == 'LIMIT'
+
+
+class TestPriceBatching:
+    """Test that single-pair price lookups are batched"""
+
+    async def test_cancelled_waiter_does_not_cancel_batch(self, gateway):
+        """Test that cancelling one lookup leaves the other pairs in its batch intact"""
+        gate = asyncio.Event()
+        gateway.routes['/market-data/prices'] = gated_route(
+            {'prices': {'ETH-USDT': 100.5, 'BTC-USDT': 200.5}, 'timestamp': 1}, gate
+        )
+
+        first = asyncio.ensure_future(gateway.client.get_market_data('binance', 'ETH-USDT'))
+        second = asyncio.ensure_future(gateway.client.get_market_data('binance', 'BTC-USDT'))
+        await wait_for_calls(gateway, 1)
+        first.cancel()
+        gate.set()
+
+        result = await second
+        assert result['status'] == 'ok'
+        assert result['price'] == 200.5
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        assert len(gateway.calls) == 1
+        assert gateway.client._price_locks == {}
+        assert await gateway.client.get_market_data('binance', 'ETH-USDT') == {
+            'status': 'ok', 'connector': 'binance', 'trading_pair': 'ETH-USDT', 'price': 100.5, 'timestamp': 1
+        }
+
+    async def test_price_locks_are_released(self, gateway):
+        """Test that per-pair locks are dropped once their lookups finish"""
+        gateway.routes['/market-data/prices'] = json_route({'prices': {'ETH-USDT': 100.5}, 'timestamp': 1})
+
+        results = await asyncio.gather(*(
+            gateway.client.get_market_data('binance', pair) for pair in ('ETH-USDT', 'eth-usdt', 'BTC-USDT')
+        ))
+
+        assert [r['status'] for r in results] == ['ok', 'ok', 'error']
+        assert gateway.client._price_locks == {}
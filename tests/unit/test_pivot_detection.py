@@ -5,48 +5,65 @@ Unit tests for Pivot Detection Skill
 import pytest
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
 from skills.pivot_detection import PivotDetectionSkill
 
 
-@pytest.fixture
+def _swing_points(*prices):
+    """Read-only swing points spaced ten minutes apart from 10:00"""
+    return tuple(
+        MappingProxyType({'price': price, 'timestamp': f'2024-01-01T10:{10 * i:02d}:00'})
+        for i, price in enumerate(prices)
+    )
+
+
+# Fixed clock for the generated frames; no test depends on wall-clock time
+_NOW = datetime(2024, 1, 1, 12, 0)
+
+SMALL_DF = pd.DataFrame({
+    'timestamp': [datetime(2024, 1, 1, 10, 0)],
+    'open': [1.2000],
+    'high': [1.2005],
+    'low': [1.1995],
+    'close': [1.2002]
+})
+
+UPTREND_SWING_HIGHS = _swing_points(1.2010, 1.2020, 1.2030)
+UPTREND_SWING_LOWS = _swing_points(1.2000, 1.2010, 1.2020)
+DOWNTREND_SWING_HIGHS = _swing_points(1.2030, 1.2020, 1.2010)
+DOWNTREND_SWING_LOWS = _swing_points(1.2020, 1.2010, 1.2000)
+SINGLE_SWING_POINT = _swing_points(1.2010)
+
+
+@pytest.fixture(scope="session")
 def pivot_skill():
-    """Create pivot detection skill for testing"""
+    """Create pivot detection skill for testing, shared across tests"""
     return PivotDetectionSkill(min_bars=3)
 
 
-@pytest.fixture
-def uptrend_data():
-     """Create sample uptrend OHLC data"""
-     dates = [datetime.now() - timedelta(minutes=i) for i in range(100, 0, -1)]
+def _trend_frame(base: float, step: float, bars: int = 100) -> pd.DataFrame:
+    """Build a steadily trending OHLC frame ending one minute before _NOW"""
+    offsets = np.arange(bars) * step
+    return pd.DataFrame({
+        'timestamp': pd.date_range(end=_NOW - timedelta(minutes=1), periods=bars, freq='min'),
+        'open': base + offsets,
+        'high': base + 0.0005 + offsets,
+        'low': base - 0.0005 + offsets,
+        'close': base + 0.0002 + offsets
+    })
 
-     # Create uptrend data
-     data = {
-         'timestamp': dates,
-         'open': [1.2000 + (i * 0.0001) for i in range(100)],
-         'high': [1.2005 + (i * 0.0001) for i in range(100)],
-         'low': [1.1995 + (i * 0.0001) for i in range(100)],
-         'close': [1.2002 + (i * 0.0001) for i in range(100)]
-     }
 
-     return pd.DataFrame(data)
+@pytest.fixture(scope="module")
+def uptrend_data():
+    """Create sample uptrend OHLC data"""
+    return _trend_frame(1.2000, 0.0001)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def downtrend_data():
-     """Create sample downtrend OHLC data"""
-     dates = [datetime.now() - timedelta(minutes=i) for i in range(100, 0, -1)]
-
-     # Create downtrend data
-     data = {
-         'timestamp': dates,
-         'open': [1.2100 - (i * 0.0001) for i in range(100)],
-         'high': [1.2105 - (i * 0.0001) for i in range(100)],
-         'low': [1.2095 - (i * 0.0001) for i in range(100)],
-         'close': [1.2102 - (i * 0.0001) for i in range(100)]
-     }
-
-     return pd.DataFrame(data)
+    """Create sample downtrend OHLC data"""
+    return _trend_frame(1.2100, -0.0001)
 
 
 class TestSwingPointDetection:
@@ -72,21 +89,115 @@ class TestSwingPointDetection:
             assert 'timestamp' in swing_high
             assert 'bar_count' in swing_high
 
+    def test_array_result_matches_dict_result(self, pivot_skill, uptrend_data):
+        """Test that the struct-of-arrays result carries the same swing points"""
+        arrays = pivot_skill.detect_swing_points_arrays(uptrend_data, swing_bars=3)
+        points = pivot_skill.detect_swing_points(uptrend_data, swing_bars=3)
+
+        for side in ('swing_highs', 'swing_lows'):
+            assert isinstance(arrays[side]['price'], np.ndarray)
+            assert arrays[side]['index'].tolist() == [p['index'] for p in points[side]]
+            assert arrays[side]['price'].tolist() == [p['price'] for p in points[side]]
+
     def test_insufficient_data_returns_empty(self, pivot_skill):
         """Test that insufficient data returns empty results"""
-        small_data = pd.DataFrame({
-            'timestamp': [datetime.now()],
-            'open': [1.2000],
-            'high': [1.2005],
-            'low': [1.1995],
-            'close': [1.2002]
-        })
-
-        result = pivot_skill.detect_swing_points(small_data, swing_bars=3)
+        result = pivot_skill.detect_swing_points(SMALL_DF, swing_bars=3)
 
         assert result['swing_highs'] == []
         assert result['swing_lows'] == []
 
+    def test_streaming_growth_matches_fresh_detection(self, pivot_skill):
+        """Test that detection on a frame grown row by row matches a fresh scan"""
+        prices = [1.2000, 1.2010, 1.2030, 1.2015, 1.2005, 1.2020, 1.2040,
+                  1.2025, 1.2010, 1.2000, 1.2015, 1.2035, 1.2020, 1.2010]
+        data = pd.DataFrame({
+            'timestamp': [datetime(2024, 1, 1) + timedelta(minutes=i) for i in range(3)],
+            'high': [p + 0.0005 for p in prices[:3]],
+            'low': [p - 0.0005 for p in prices[:3]]
+        })
+
+        for i in range(3, len(prices)):
+            data.loc[i] = [datetime(2024, 1, 1) + timedelta(minutes=i),
+                           prices[i] + 0.0005, prices[i] - 0.0005]
+            streamed = pivot_skill.detect_swing_points(data, swing_bars=2)
+            fresh = PivotDetectionSkill().detect_swing_points(data.copy(), swing_bars=2)
+
+            assert streamed == fresh
+
+    def test_in_place_edit_matches_fresh_detection(self, pivot_skill):
+        """Test that editing an earlier bar in place is seen by the next scan"""
+        highs = [1.0, 2.0, 3.0, 2.0, 1.0, 2.0, 4.0, 2.0, 1.0]
+        data = pd.DataFrame({
+            'timestamp': [datetime(2024, 1, 1) + timedelta(minutes=i) for i in range(len(highs))],
+            'high': highs,
+            'low': [h - 0.5 for h in highs]
+        })
+
+        before = pivot_skill.detect_swing_points(data, swing_bars=2)
+        data.loc[2, 'high'] = 0.0
+        after = pivot_skill.detect_swing_points(data, swing_bars=2)
+
+        assert [p['index'] for p in before['swing_highs']] == [2, 6]
+        assert after == PivotDetectionSkill().detect_swing_points(data.copy(), swing_bars=2)
+        assert [p['index'] for p in after['swing_highs']] == [6]
+
+    def test_multi_instrument_matches_single(self, pivot_skill, uptrend_data, downtrend_data):
+        """Test that stacked detection matches per-symbol detection"""
+        frames = [uptrend_data, downtrend_data]
+        stack = np.stack([f[['high', 'low']].to_numpy() for f in frames])
+
+        results = pivot_skill.detect_swing_points_multi(stack, swing_bars=3)
+
+        assert len(results) == len(frames)
+        for frame, result in zip(frames, results):
+            single = PivotDetectionSkill().detect_swing_points_arrays(frame, swing_bars=3)
+            for side in ('swing_highs', 'swing_lows'):
+                assert result[side]['index'].tolist() == single[side]['index'].tolist()
+                assert result[side]['price'].tolist() == single[side]['price'].tolist()
+
+
+# (timestamp column, expected swing high timestamps) for a peak at bars 2 and 6
+_LONDON_START = pd.Timestamp('2024-06-01 09:30:00.250', tz='Europe/London')
+TIMESTAMP_CASES = [
+    pytest.param(
+        pd.date_range(_LONDON_START, periods=9, freq='min'),
+        ['2024-06-01T09:32:00.250000+01:00', '2024-06-01T09:36:00.250000+01:00'],
+        id='tz_aware_sub_second'),
+    pytest.param(
+        pd.date_range(pd.Timestamp('2024-01-01 09:30', tz='UTC'), periods=9, freq='min'),
+        ['2024-01-01T09:32:00+00:00', '2024-01-01T09:36:00+00:00'],
+        id='utc'),
+    pytest.param(
+        pd.Series([pd.Timestamp('2024-01-01 09:30', tz='UTC') + pd.Timedelta(minutes=i)
+                   for i in range(9)], dtype=object),
+        ['2024-01-01T09:32:00+00:00', '2024-01-01T09:36:00+00:00'],
+        id='object_timestamps'),
+    pytest.param(
+        pd.Series([datetime(2024, 1, 1, 9, 30 + i, tzinfo=timezone.utc) for i in range(9)], dtype=object),
+        ['2024-01-01 09:32:00+00:00', '2024-01-01 09:36:00+00:00'],
+        id='object_datetimes'),
+]
+
+
+class TestSwingTimestamps:
+    """Test swing point timestamp formatting"""
+
+    @pytest.mark.parametrize("timestamps, expected", TIMESTAMP_CASES)
+    def test_timestamps_keep_isoformat(self, pivot_skill, timestamps, expected):
+        """Test that pandas timestamps keep isoformat() output and other values str()"""
+        highs = [1.0, 2.0, 3.0, 2.0, 1.0, 2.0, 4.0, 2.0, 1.0]
+        data = pd.DataFrame({
+            'timestamp': timestamps,
+            'high': highs,
+            'low': [h - 0.5 for h in highs]
+        })
+
+        points = pivot_skill.detect_swing_points(data, swing_bars=2)
+        arrays = pivot_skill.detect_swing_points_arrays(data, swing_bars=2)
+
+        assert [p['timestamp'] for p in points['swing_highs']] == expected
+        assert arrays['swing_highs']['timestamp'].tolist() == expected
+
 
 class TestTrendClassification:
     """Test trend classification"""
@@ -95,47 +206,22 @@ class TestTrendClassification:
         """Test uptrend is correctly identified"""
         swing_points = pivot_skill.detect_swing_points(uptrend_data)
 
-        # Manually create higher highs and higher lows
-        swing_highs = [
-            {'price': 1.2010, 'timestamp': '2024-01-01T10:00:00'},
-            {'price': 1.2020, 'timestamp': '2024-01-01T10:10:00'},
-            {'price': 1.2030, 'timestamp': '2024-01-01T10:20:00'}
-        ]
-        swing_lows = [
-            {'price': 1.2000, 'timestamp': '2024-01-01T10:00:00'},
-            {'price': 1.2010, 'timestamp': '2024-01-01T10:10:00'},
-            {'price': 1.2020, 'timestamp': '2024-01-01T10:20:00'}
-        ]
-
-        result = pivot_skill.classify_trend(swing_highs, swing_lows)
+        # Higher highs and higher lows
+        result = pivot_skill.classify_trend(UPTREND_SWING_HIGHS, UPTREND_SWING_LOWS)
 
         assert result['trend'] == 'uptrend'
         assert result['confidence'] > 0
 
     def test_downtrend_detection(self, pivot_skill):
         """Test downtrend is correctly identified"""
-        swing_highs = [
-            {'price': 1.2030, 'timestamp': '2024-01-01T10:00:00'},
-            {'price': 1.2020, 'timestamp': '2024-01-01T10:10:00'},
-            {'price': 1.2010, 'timestamp': '2024-01-01T10:20:00'}
-        ]
-        swing_lows = [
-            {'price': 1.2020, 'timestamp': '2024-01-01T10:00:00'},
-            {'price': 1.2010, 'timestamp': '2024-01-01T10:10:00'},
-            {'price': 1.2000, 'timestamp': '2024-01-01T10:20:00'}
-        ]
-
-        result = pivot_skill.classify_trend(swing_highs, swing_lows)
+        result = pivot_skill.classify_trend(DOWNTREND_SWING_HIGHS, DOWNTREND_SWING_LOWS)
 
         assert result['trend'] == 'downtrend'
         assert result['confidence'] > 0
 
     def test_insufficient_swings_returns_unknown(self, pivot_skill):
         """Test that insufficient swing points returns unknown"""
-        result = pivot_skill.classify_trend(
-            [{'price': 1.2000, 'timestamp': '2024-01-01T10:00:00'}],
-            [{'price': 1.1990, 'timestamp': '2024-01-01T10:00:00'}]
-        )
+        result = pivot_skill.classify_trend(_swing_points(1.2000), _swing_points(1.1990))
 
         assert result['trend'] == 'unknown'
 
@@ -160,6 +246,27 @@ class TestSupportResistanceZones:
         # Should create at least one zone from the first 3 nearby points
         assert len(zones) >= 1
 
+    def test_zone_grouping_is_order_independent(self, pivot_skill):
+        """Test that shuffling swing points yields the same zones"""
+        swing_points = [
+            {'price': 1.2050, 'timestamp': '2024-01-01T10:00:00'},
+            {'price': 1.2001, 'timestamp': '2024-01-01T10:10:00'},
+            {'price': 1.2051, 'timestamp': '2024-01-01T10:20:00'},
+            {'price': 1.2000, 'timestamp': '2024-01-01T10:30:00'},
+            {'price': 1.2002, 'timestamp': '2024-01-01T10:40:00'}
+        ]
+
+        zones = pivot_skill.find_support_resistance_zones(swing_points)
+        reversed_zones = pivot_skill.find_support_resistance_zones(swing_points[::-1])
+
+        def summary(zs):
+            return sorted((z['price_low'], z['price_high'], z['touches']) for z in zs)
+
+        assert summary(zones) == summary(reversed_zones)
+        assert summary(zones) == [(1.2000, 1.2002, 3), (1.2050, 1.2051, 2)]
+        assert zones[0]['first_touch'] == '2024-01-01T10:10:00'
+        assert zones[0]['last_touch'] == '2024-01-01T10:40:00'
+
     def test_zone_strength_calculation(self, pivot_skill):
         """Test that zone strength is calculated correctly"""
         swing_points = [
@@ -180,15 +287,11 @@ class TestStructureBreak:
 
     def test_uptrend_structure_break(self, pivot_skill):
         """Test structure break in uptrend"""
-        swing_lows = [
-            {'price': 1.2010, 'timestamp': '2024-01-01T10:00:00'}
-        ]
-
         result = pivot_skill.identify_structure_break(
             current_price=1.2005,  # Below last higher low
             trend='uptrend',
             swing_highs=[],
-            swing_lows=swing_lows
+            swing_lows=SINGLE_SWING_POINT
         )
 
         assert result['structure_broken'] == True
@@ -196,14 +299,10 @@ class TestStructureBreak:
 
     def test_downtrend_structure_break(self, pivot_skill):
         """Test structure break in downtrend"""
-        swing_highs = [
-            {'price': 1.2010, 'timestamp': '2024-01-01T10:00:00'}
-        ]
-
         result = pivot_skill.identify_structure_break(
             current_price=1.2015,  # Above last lower high
             trend='downtrend',
-            swing_highs=swing_highs,
+            swing_highs=SINGLE_SWING_POINT,
             swing_lows=[]
         )
 
@@ -212,15 +311,11 @@ class TestStructureBreak:
 
     def test_no_structure_break(self, pivot_skill):
         """Test no structure break"""
-        swing_lows = [
-            {'price': 1.2010, 'timestamp': '2024-01-01T10:00:00'}
-        ]
-
         result = pivot_skill.identify_structure_break(
             current_price=1.2015,  # Above last higher low (good)
             trend='uptrend',
             swing_highs=[],
-            swing_lows=swing_lows
+            swing_lows=SINGLE_SWING_POINT
         )
 
         assert result['structure_broken'] == False
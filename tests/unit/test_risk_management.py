@@ -57,6 +57,39 @@ def base_state():
     }
 
 
+def reference_position_size(account_balance, entry_price, stop_price, instrument_spec, risk_pct=1.0):
+    """YTC position size formula in plain Python, as the agent computed it before the kernel"""
+    risk_amount = account_balance * (risk_pct / 100)
+    stop_distance = abs(entry_price - stop_price)
+    tick_size = instrument_spec.get('tick_size', 0.0001)
+    tick_value = instrument_spec.get('tick_value', 10.0)
+    contract_size = instrument_spec.get('contract_size', 1000)
+    min_size = instrument_spec.get('min_size', 1000)
+    max_size = instrument_spec.get('max_size', 1000000)
+
+    stop_distance_ticks = int(stop_distance / tick_size) if tick_size > 0 else 0
+    if stop_distance_ticks > 0 and tick_value > 0:
+        position_size = risk_amount / (stop_distance_ticks * tick_value)
+        contracts = int(position_size / contract_size) * contract_size
+        contracts = max(min_size, min(contracts, max_size))
+    else:
+        contracts = 0
+
+    actual_risk = contracts / contract_size * stop_distance_ticks * tick_value
+    return {
+        'position_size_contracts': contracts,
+        'position_size_lots': contracts / contract_size,
+        'risk_amount_target': risk_amount,
+        'risk_amount_actual': actual_risk,
+        'risk_pct_target': risk_pct,
+        'risk_pct_actual': (actual_risk / account_balance) * 100 if account_balance > 0 else 0,
+        'stop_distance': stop_distance,
+        'stop_distance_ticks': stop_distance_ticks,
+        'entry_price': entry_price,
+        'stop_price': stop_price
+    }
+
+
 class TestPositionSizing:
     """Test position sizing calculations"""
 
@@ -102,6 +135,51 @@ class TestPositionSizing:
         # Should be capped at max_size
         assert result['position_size_contracts'] <= 500000
 
+    def test_repeated_sizing_returns_independent_copies(self, risk_agent):
+        """Test that a memoized sizing result matches and is not shared"""
+        kwargs = dict(
+            account_balance=100000,
+            entry_price=1.2500,
+            stop_price=1.2450,
+            instrument_spec={'tick_size': 0.0001, 'tick_value': 10.0, 'contract_size': 1000},
+            risk_pct=1.0
+        )
+
+        first = risk_agent.calculate_position_size(**kwargs)
+        first['position_size_contracts'] = -1
+        second = risk_agent.calculate_position_size(**kwargs)
+
+        assert second['position_size_contracts'] != -1
+        assert second == risk_agent.calculate_position_size(**kwargs)
+
+    @pytest.mark.parametrize("balance, entry, stop, spec", [
+        pytest.param(100000, 1.25, 1.2475, {'tick_size': 0.0001, 'tick_value': 10.0, 'contract_size': 100000.0,
+                                           'min_size': 1000, 'max_size': 1000000}, id='float_contract_int_bounds'),
+        pytest.param(100000, 1.25, 1.2499, {'tick_size': 0.0001, 'tick_value': 10.0, 'contract_size': 1000,
+                                           'min_size': 5000.0, 'max_size': 1000000}, id='float_min_size_wins'),
+        pytest.param(1000000, 1.25, 1.2499, {'tick_size': 0.0001, 'tick_value': 10.0, 'contract_size': 1000,
+                                            'min_size': 1000, 'max_size': 500000.0}, id='float_max_size_wins'),
+        pytest.param(100000, 1.25, 1.2475, {'tick_size': 0.0001, 'tick_value': 10.0, 'contract_size': 1,
+                                           'min_size': 1, 'max_size': 4.0}, id='float_max_size_tie'),
+        pytest.param(100000, 1250, 1240, {'tick_size': 1, 'tick_value': 10, 'contract_size': 1,
+                                         'min_size': 1, 'max_size': 1000}, id='integer_prices'),
+        pytest.param(100000, 1.25, 1.25, {'tick_size': 0.0001, 'tick_value': 10.0, 'contract_size': 1000.0}, id='no_stop'),
+        pytest.param(0, 1.25, 1.2475, {'tick_size': 0.0001, 'tick_value': 10.0, 'contract_size': 1000}, id='zero_balance'),
+    ])
+    def test_kernel_matches_plain_formula(self, risk_agent, balance, entry, stop, spec):
+        """Test that the kernel result matches the plain Python formula"""
+        result = risk_agent.calculate_position_size(balance, entry, stop, spec)
+        # The same spec with float sizes must not be served from the integer entry
+        float_spec = {k: float(v) for k, v in spec.items()}
+        float_result = risk_agent.calculate_position_size(balance, entry, stop, float_spec)
+
+        for got, used in ((result, spec), (float_result, float_spec)):
+            assert got == reference_position_size(balance, entry, stop, used)
+            assert isinstance(got['stop_distance_ticks'], int)
+
+        integer_sizes = all(isinstance(spec.get(k, 1000), int) for k in ('contract_size', 'min_size', 'max_size'))
+        assert isinstance(result['position_size_contracts'], int) is integer_sizes
+        assert isinstance(float_result['position_size_contracts'], float)
 
 class TestRiskLimits:
     """Test risk limit enforcement"""
@@ -4,12 +4,131 @@ Direct HTTP client for Hummingbot Gateway API integration
 Uses the actual Hummingbot REST API endpoints (not MCP protocol)
 """
 
+import asyncio
+import json
+import os
+import random
+import time
+from functools import lru_cache
 import aiohttp
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
 import structlog
 
+# orjson is optional; fall back to the stdlib encoder when it is missing
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# ijson is optional; without it large trade histories are buffered whole
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# aiodns is optional; with it host lookups run on c-ares instead of a thread pool
+try:
+    import aiodns  # noqa: F401
+    AIODNS_AVAILABLE = True
+except ImportError:
+    AIODNS_AVAILABLE = False
+
+# aiohttp can only decode brotli responses when a brotli module is installed
+try:
+    import brotli  # noqa: F401
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
 logger = structlog.get_logger()
 
+# Connection pool sizing shared by every request the client makes
+POOL_LIMIT = 200
+POOL_LIMIT_PER_HOST = 64
+KEEPALIVE_TIMEOUT = 30
+DNS_CACHE_TTL = 300
+
+# One in this many requests is also logged at INFO, so request volume stays
+# visible when DEBUG events are filtered out
+LOG_SAMPLE_N = max(1, int(os.getenv("GATEWAY_LOG_SAMPLE", "100")))
+
+# Seconds a response may be reused, per read endpoint served through _cached_request
+READ_CACHE_TTLS = {
+    "/portfolio/state": 10.0,
+    "/connectors/": 300.0
+}
+
+# Read endpoints whose cached responses an order placement or cancellation makes stale
+ORDER_INVALIDATED_ENDPOINTS = frozenset({"/portfolio/state"})
+
+# Seconds a positions snapshot from get_positions can stand in for a fresh
+# fetch when close_position is given an explicit amount
+POSITIONS_CACHE_TTL = 1.0
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Sent with every request; aiohttp decompresses responses transparently
+DEFAULT_HEADERS = {
+    "Accept": "application/json",
+    "Accept-Encoding": "gzip, deflate, br" if BROTLI_AVAILABLE else "gzip, deflate",
+    "User-Agent": "ytc-agents/1.0"
+}
+
+if ORJSON_AVAILABLE:
+    # Allow numpy floats computed by the agents to be sent in order payloads
+    _ORJSON_OPTS = orjson.OPT_SERIALIZE_NUMPY
+
+    def _json_dumps(data: Any) -> bytes:
+        return orjson.dumps(data, option=_ORJSON_OPTS)
+
+    _json_loads = orjson.loads
+else:
+    def _json_dumps(data: Any) -> bytes:
+        return json.dumps(data).encode()
+
+    _json_loads = json.loads
+
+
+def _rows(result: Any, alt_key: str) -> list:
+    """
+    Extract the row list from a Gateway list response.
+
+    The Gateway returns either a bare list or a dict holding the rows under
+    "rows" or an endpoint-specific key. Decoded JSON is always a plain dict
+    or list, so exact type checks are safe here.
+    """
+    if type(result) is dict:
+        return result["rows"] if "rows" in result else result.get(alt_key, [])
+    return result if type(result) is list else []
+
+
+# Order types the Gateway accepts; anything else is sent as MARKET
+_ORDER_ENUMS = frozenset({"MARKET", "LIMIT", "LIMIT_MAKER"})
+
+# Common spellings of the order side, checked before lower-casing
+_SIDE_MAP = {"buy": "BUY", "sell": "SELL", "BUY": "BUY", "SELL": "SELL"}
+
+# Trade history requests above this many rows are parsed as a stream
+STREAM_TRADES_THRESHOLD = 1000
+
+# Attempts per request for calls that are safe to repeat
+MAX_REQUEST_ATTEMPTS = 3
+
+
+class GatewayHTTPError(Exception):
+    """Gateway responded with a non-success HTTP status"""
+
+    def __init__(self, status: int, text: str):
+        super().__init__(f"Gateway API error ({status}): {text}")
+        self.status = status
+        self.text = text
+
+
+class TransientHTTPError(GatewayHTTPError):
+    """Gateway responded with a status that is worth retrying"""
+
 
 class HummingbotGatewayClient:
     """
@@ -17,12 +136,26 @@ class HummingbotGatewayClient:
     Communicates directly with the Gateway REST API.
     """
 
+    _RETRYABLE_STATUSES = frozenset({408, 429, 502, 503, 504})
+
+    # POST endpoints that only read state, so repeating them is harmless
+    _READ_ENDPOINTS = frozenset({
+        "/portfolio/state",
+        "/market-data/prices",
+        "/market-data/order-book",
+        "/connectors/",
+        "/trading/positions",
+        "/trading/orders/active",
+        "/trading/trades"
+    })
+
     def __init__(
         self,
         gateway_url: str = "http://localhost:8000",
         account_name: str = "default",
         username: Optional[str] = None,
-        password: Optional[str] = None
+        password: Optional[str] = None,
+        price_ttl: float = 0.25
     ):
         """
         Initialize Gateway API client.
@@ -32,6 +165,7 @@ class HummingbotGatewayClient:
             account_name: Default account name to use for trading
             username: Optional username for authentication
             password: Optional password for authentication
+            price_ttl: Seconds a fetched price is reused (0 disables caching)
         """
         self.gateway_url = gateway_url.rstrip('/')
         self.account_name = account_name
@@ -40,6 +174,37 @@ class HummingbotGatewayClient:
         self.logger = logger.bind(component="gateway_client")
         self.session: Optional[aiohttp.ClientSession] = None
         self.auth: Optional[aiohttp.BasicAuth] = None
+        self._timeout = aiohttp.ClientTimeout(total=30, connect=5, sock_read=25)
+        self._health_timeout = aiohttp.ClientTimeout(total=5)
+        self._session_lock = asyncio.Lock()
+        self.price_ttl = price_ttl
+        # (connector, trading_pair) -> (expiry_monotonic, price, timestamp)
+        self._price_cache: Dict[Tuple[str, str], Tuple[float, float, Any]] = {}
+        # (connector, trading_pair) -> lock for a price lookup in progress; removed once free
+        self._price_locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+        # connector -> (pairs waiting for the next batch, future for its result)
+        self._pending_prices: Dict[str, Tuple[List[str], asyncio.Future]] = {}
+        self._background_tasks: Set[asyncio.Task] = set()
+        # (method, endpoint, body) -> (expiry_monotonic, serialized response)
+        self._read_cache: Dict[Tuple[str, str, Optional[bytes]], Tuple[float, bytes]] = {}
+        # (account, connector, trading_pair) -> (fetched_monotonic, position or None)
+        self._positions_cache: Dict[Tuple[str, str, str], Tuple[float, Optional[Dict[str, Any]]]] = {}
+        # (read cache entry for /connectors/, the string names in it as a set)
+        self._connector_names: Optional[Tuple[Any, frozenset]] = None
+        # (method, endpoint, body, params, timeout) -> task for a read request still in flight
+        self._inflight: Dict[Tuple[str, str, Optional[bytes], Optional[Tuple], Optional[aiohttp.ClientTimeout]], asyncio.Task] = {}
+
+        # Bounded memo of endpoint -> full URL for this client's fixed base URL
+        self._build_url = lru_cache(maxsize=256)(self.gateway_url.__add__)
+        # Per-request logging: every request at DEBUG, a 1-in-N sample at INFO.
+        # Level filtering is left to the structlog configuration, so it
+        # follows level changes made after the client is created.
+        self._sample_n = LOG_SAMPLE_N
+        self._req_counter = 0
+
+        # Bounded memos of raw name -> canonical name (pairs upper case, connectors lower case)
+        self._norm_pair = lru_cache(maxsize=1024)(str.upper)
+        self._norm_connector = lru_cache(maxsize=256)(str.lower)
 
         if username and password:
             self.auth = aiohttp.BasicAuth(username, password)
@@ -47,9 +212,32 @@ class HummingbotGatewayClient:
         self.logger.info("gateway_client_initialized", gateway_url=self.gateway_url, account=account_name, auth_enabled=bool(self.auth))
 
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session"""
-        if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession()
+        """
+        Get or create the pooled aiohttp session.
+
+        The connector is built here rather than in __init__ because it must
+        be created inside a running event loop. The lock keeps concurrent
+        first callers from opening two sessions.
+        """
+        if self.session is not None and not self.session.closed:
+            return self.session
+
+        async with self._session_lock:
+            if self.session is None or self.session.closed:
+                connector = aiohttp.TCPConnector(
+                    resolver=aiohttp.AsyncResolver() if AIODNS_AVAILABLE else None,
+                    limit=POOL_LIMIT,
+                    limit_per_host=POOL_LIMIT_PER_HOST,
+                    keepalive_timeout=KEEPALIVE_TIMEOUT,
+                    ttl_dns_cache=DNS_CACHE_TTL,
+                    enable_cleanup_closed=True
+                )
+                self.session = aiohttp.ClientSession(
+                    connector=connector,
+                    timeout=self._timeout,
+                    auth=self.auth,
+                    headers=DEFAULT_HEADERS
+                )
         return self.session
 
     async def _request(
@@ -57,44 +245,217 @@ class HummingbotGatewayClient:
         method: str,
         endpoint: str,
         data: Optional[Dict[str, Any]] = None,
-        params: Optional[Dict[str, Any]] = None
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[aiohttp.ClientTimeout] = None
     ) -> Dict[str, Any]:
         """
         Make HTTP request to Gateway API.
 
+        GETs and read-only POSTs are retried with exponential backoff on
+        connection errors and retryable statuses, and concurrent identical
+        reads share a single in-flight request. Each caller decodes the shared
+        response body itself, so no two callers get the same object. Other
+        POSTs, such as order placement, are sent exactly once per call.
+
         Args:
             method: HTTP method (GET, POST, etc.)
             endpoint: API endpoint path
             data: Request body data (for POST)
             params: Query parameters (for GET)
+            timeout: Timeout for this request instead of the session default
 
         Returns:
             Response data as dictionary
+
+        Raises:
+            GatewayHTTPError: If the Gateway responds with a non-success status
+        """
+        # GET sends no body; every other method sends data as JSON
+        body = _json_dumps(data) if method != "GET" else None
+
+        if method != "GET" and endpoint not in self._READ_ENDPOINTS:
+            return _json_loads(await self._send_request(method, endpoint, body, params, timeout, retryable=False))
+
+        key = (method, endpoint, body, tuple(sorted(params.items())) if params else None, timeout)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._send_request(method, endpoint, body, params, timeout, retryable=True))
+            self._inflight[key] = task
+
+            def _forget(done: asyncio.Task):
+                self._inflight.pop(key, None)
+                # Mark a failure as retrieved in case every caller was cancelled
+                if not done.cancelled():
+                    done.exception()
+
+            task.add_done_callback(_forget)
+        # Shielded so one cancelled caller does not cancel the request for the others
+        return _json_loads(await asyncio.shield(task))
+
+    async def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        body: Optional[bytes],
+        params: Optional[Dict[str, Any]],
+        timeout: Optional[aiohttp.ClientTimeout],
+        retryable: bool
+    ) -> bytes:
+        """
+        Send one request to the Gateway API, retrying it if allowed.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint path
+            body: Serialized JSON body, or None
+            params: Query parameters (for GET)
+            timeout: Timeout for this request instead of the session default
+            retryable: Whether the request is safe to repeat
+
+        Returns:
+            Raw JSON response body
         """
         session = await self._get_session()
-        url = f"{self.gateway_url}{endpoint}"
+        url = self._build_url(endpoint)
+
+        self._req_counter += 1
+        self.logger.debug("gateway_api_request", method=method, endpoint=endpoint, url=url)
+        if self._req_counter % self._sample_n == 0:
+            self.logger.info("gateway_api_request_sample", method=method, endpoint=endpoint, sampled_of=self._sample_n)
+
+        headers = JSON_HEADERS if body is not None else None
+        attempts = MAX_REQUEST_ATTEMPTS if retryable else 1
+
+        for attempt in range(attempts):
+            try:
+                async with session.request(
+                    method, url, params=params, data=body, headers=headers,
+                    timeout=timeout or self._timeout
+                ) as resp:
+                    if resp.status in (200, 201):
+                        return await resp.read()
+
+                    error_cls = TransientHTTPError if resp.status in self._RETRYABLE_STATUSES else GatewayHTTPError
+                    raise error_cls(resp.status, await resp.text())
+
+            except (aiohttp.ClientError, TransientHTTPError) as e:
+                if attempt + 1 < attempts:
+                    delay = min(0.05 * 2 ** attempt + random.uniform(0, 0.05), 1.0)
+                    self.logger.warning("gateway_request_retry", error=str(e), endpoint=endpoint, attempt=attempt + 1, delay=delay)
+                    await asyncio.sleep(delay)
+                    continue
+
+                if isinstance(e, TransientHTTPError):
+                    raise
+
+                self.logger.error("gateway_request_failed", error=str(e), endpoint=endpoint)
+                raise Exception(f"Gateway API request failed: {str(e)}")
+
+    async def _cached_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        """
+        Make a read request, reusing the response for the endpoint's TTL.
 
-        self.logger.info("gateway_api_request", method=method, endpoint=endpoint, url=url)
+        TTLs come from READ_CACHE_TTLS; endpoints not listed there are
+        always fetched. Orders and cancellations clear the cache. Responses
+        are cached in serialized form, so every caller gets its own copy
+        and changing a result cannot corrupt the cache.
 
-        try:
-            if method == "GET":
-                async with session.get(url, params=params, auth=self.auth, timeout=aiohttp.ClientTimeout(total=30)) as resp:
-                    if resp.status in [200, 201]:
-                        return await resp.json()
-                    else:
-                        error_text = await resp.text()
-                        raise Exception(f"Gateway API error ({resp.status}): {error_text}")
-
-            elif method == "POST":
-                async with session.post(url, json=data, auth=self.auth, timeout=aiohttp.ClientTimeout(total=30)) as resp:
-                    if resp.status in [200, 201]:
-                        return await resp.json()
-                    else:
-                        error_text = await resp.text()
-                        raise Exception(f"Gateway API error ({resp.status}): {error_text}")
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint path
+            data: Request body data (for POST)
 
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
+        Returns:
+            Response data
+        """
+        ttl = READ_CACHE_TTLS.get(endpoint)
+        if not ttl:
+            return await self._request(method, endpoint, data=data)
+
+        key = (method, endpoint, _json_dumps(data) if data is not None else None)
+        entry = self._read_cache.get(key)
+        if entry is not None and time.monotonic() < entry[0]:
+            return _json_loads(entry[1])
+
+        result = await self._request(method, endpoint, data=data)
+        self._read_cache[key] = (time.monotonic() + ttl, _json_dumps(result))
+        return result
+
+    async def _request_stream(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        alt_key: str = "rows"
+    ) -> AsyncIterator[Any]:
+        """
+        Make HTTP request to Gateway API and yield response rows as they parse.
+
+        Accepts the same response shapes as _rows: a bare list, or a dict
+        holding the rows under "rows" or alt_key, with "rows" preferred when
+        both are present. Requires ijson. Partial responses cannot be
+        replayed, so streamed requests are not retried.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint path
+            data: Request body data (for POST)
+            alt_key: Endpoint-specific key holding the rows
+
+        Yields:
+            Parsed rows
+        """
+        session = await self._get_session()
+        url = self._build_url(endpoint)
+        body = _json_dumps(data) if method != "GET" else None
+        headers = JSON_HEADERS if body is not None else None
+        alt_prefix = f"{alt_key}.item" if alt_key != "rows" else None
+        row_prefixes = ("item", "rows.item", alt_prefix)
+
+        try:
+            async with session.request(method, url, data=body, headers=headers) as resp:
+                if resp.status not in (200, 201):
+                    raise GatewayHTTPError(resp.status, await resp.text())
+
+                # Like _rows, "rows" wins over alt_key wherever it appears in the
+                # object, so alt_key rows are held back until the object ends
+                has_rows = False
+                alt_rows = []
+                item_prefix = None
+                builder = None
+                async for prefix, event, value in ijson.parse(resp.content, use_float=True):
+                    if builder is not None:
+                        builder.event(event, value)
+                        if prefix == item_prefix and event in ("end_map", "end_array"):
+                            if item_prefix == alt_prefix:
+                                alt_rows.append(builder.value)
+                            else:
+                                yield builder.value
+                            builder = None
+                        continue
+
+                    if prefix == "" and event == "map_key" and value == "rows":
+                        has_rows = True
+                    if prefix not in row_prefixes:
+                        continue
+                    if event in ("start_map", "start_array"):
+                        item_prefix = prefix
+                        builder = ijson.ObjectBuilder()
+                        builder.event(event, value)
+                    elif event not in ("end_map", "end_array"):
+                        if prefix == alt_prefix:
+                            alt_rows.append(value)
+                        else:
+                            yield value
+
+                if not has_rows:
+                    for row in alt_rows:
+                        yield row
 
         except aiohttp.ClientError as e:
             self.logger.error("gateway_request_failed", error=str(e), endpoint=endpoint)
@@ -111,7 +472,7 @@ class HummingbotGatewayClient:
         """
         try:
             # Check if we can get portfolio state (indicates gateway is working)
-            result = await self._request("POST", "/portfolio/state", data={})
+            result = await self._request("POST", "/portfolio/state", data={}, timeout=self._health_timeout)
             return {
                 "status": "healthy",
                 "gateway_url": self.gateway_url,
@@ -135,11 +496,18 @@ class HummingbotGatewayClient:
         Returns:
             Connector status
         """
+        connector = self._norm_connector(connector)
+
         try:
             # List available connectors
-            result = await self._request("GET", "/connectors/")
+            result = await self._cached_request("GET", "/connectors/")
             connectors = result.get("connectors", []) if isinstance(result, dict) else result
-            is_available = connector in connectors
+            # Rebuild the lookup set only when a fresh list has been cached. Non-string
+            # entries (e.g. connector objects) can never equal a name, so they are skipped
+            entry = self._read_cache.get(("GET", "/connectors/", None))
+            if entry is None or self._connector_names is None or self._connector_names[0] is not entry:
+                self._connector_names = (entry, frozenset(c for c in connectors if isinstance(c, str)))
+            is_available = connector in self._connector_names[1]
 
             return {
                 "connector": connector,
@@ -154,6 +522,16 @@ class HummingbotGatewayClient:
                 "error": str(e)
             }
 
+    def _invalidate_order_reads(self) -> None:
+        """Drop cached reads an order can change (balances), keeping the connector list"""
+        for key in [key for key in self._read_cache if key[1] in ORDER_INVALIDATED_ENDPOINTS]:
+            del self._read_cache[key]
+
+    def refresh_connectors(self) -> None:
+        """Drop the cached connector list so the next status check refetches it"""
+        self._read_cache.pop(("GET", "/connectors/", None), None)
+        self._connector_names = None
+
     # ==================== Portfolio & Balance ====================
 
     async def get_balance(self, connector: str, account_name: Optional[str] = None) -> Dict[str, Any]:
@@ -168,10 +546,11 @@ class HummingbotGatewayClient:
             Balance information
         """
         account = account_name or self.account_name
+        connector = self._norm_connector(connector)
         
         try:
             # Get portfolio state
-            result = await self._request(
+            result = await self._cached_request(
                 "POST",
                 "/portfolio/state",
                 data={}
@@ -190,13 +569,17 @@ class HummingbotGatewayClient:
                 if account_data:
                     connector_data = account_data.get(connector, [])
                     if connector_data:
-                        # Sum available units (not units, which might include short positions)
-                        total_balance = sum(float(item.get("available_units", 0)) for item in connector_data)
-                        # Get primary currency (first token or USDT if available)
-                        primary_currency = next(
-                            (item.get("token", "USDT") for item in connector_data if item.get("token") == "USDT"),
-                            connector_data[0].get("token", "USDT") if connector_data else "USDT"
-                        )
+                        # Single pass: sum available units (not units, which might include
+                        # short positions) and note whether USDT is among the tokens
+                        total_balance = 0.0
+                        has_usdt = False
+                        for item in connector_data:
+                            total_balance += float(item.get("available_units", 0))
+                            if item.get("token") == "USDT":
+                                has_usdt = True
+
+                        # Get primary currency (USDT if available, else the first token)
+                        primary_currency = "USDT" if has_usdt else connector_data[0].get("token", "USDT")
                         return {
                             "status": "ok",
                             "account": account,
@@ -241,6 +624,8 @@ class HummingbotGatewayClient:
             Positions information
         """
         account = account_name or self.account_name
+        connector = self._norm_connector(connector) if connector else connector
+        trading_pair = self._norm_pair(trading_pair) if trading_pair else trading_pair
         
         try:
             # Build filter request
@@ -255,18 +640,14 @@ class HummingbotGatewayClient:
             result = await self._request("POST", "/trading/positions", data=filter_data)
 
             # Parse positions from response
-            if isinstance(result, dict):
-                positions = result.get("rows", []) if "rows" in result else result.get("positions", [])
-                return {
-                    "status": "ok",
-                    "positions": positions,
-                    "count": len(positions)
-                }
+            positions = _rows(result, "positions")
+
+            self._remember_positions(account, connector, trading_pair, positions)
 
             return {
                 "status": "ok",
-                "positions": result if isinstance(result, list) else [],
-                "count": len(result) if isinstance(result, list) else 0
+                "positions": positions,
+                "count": len(positions)
             }
 
         except Exception as e:
@@ -278,6 +659,31 @@ class HummingbotGatewayClient:
                 "count": 0
             }
 
+    def _remember_positions(
+        self,
+        account: str,
+        connector: str,
+        trading_pair: Optional[str],
+        positions: list
+    ):
+        """Store a positions snapshot so close_position can skip a fetch"""
+        if not account or account == "all" or not connector or connector == "all":
+            return
+
+        now = time.monotonic()
+        if trading_pair:
+            # A filtered empty result also records that there is no position
+            self._positions_cache[(account, connector, trading_pair)] = (
+                now, positions[0] if positions else None
+            )
+            return
+
+        # Reversed so the first row per pair wins, matching close_position
+        for position in reversed(positions):
+            pair = position.get("trading_pair") if isinstance(position, dict) else None
+            if pair:
+                self._positions_cache[(account, connector, pair)] = (now, position)
+
     # ==================== Trading ====================
 
     async def place_order(
@@ -303,30 +709,63 @@ class HummingbotGatewayClient:
             account_name: Optional account name
 
         Returns:
-            Order result
+            Order result; invalid amounts or prices are reported as an
+            error status without contacting the Gateway
         """
         account = account_name or self.account_name
+        connector = self._norm_connector(connector)
+        trading_pair = self._norm_pair(trading_pair)
         
         try:
             # Normalize inputs
-            trade_type = "BUY" if side.lower() == "buy" else "SELL"
-            order_enum = order_type.upper() if order_type.upper() in ["MARKET", "LIMIT", "LIMIT_MAKER"] else "MARKET"
-
-            payload = {
-                "account_name": account,
-                "connector_name": connector,
-                "trading_pair": trading_pair,
-                "trade_type": trade_type,
-                "amount": amount,
-                "order_type": order_enum
-            }
+            trade_type = _SIDE_MAP.get(side) or ("BUY" if side.lower() == "buy" else "SELL")
+            order_enum = order_type.upper()
+            if order_enum not in _ORDER_ENUMS:
+                order_enum = "MARKET"
+
+            # Reject orders the Gateway would refuse before spending a round trip on them
+            try:
+                amount = float(amount)
+            except (TypeError, ValueError):
+                raise ValueError(f"Order amount must be a number, got {amount!r}") from None
+            if not amount > 0:
+                raise ValueError(f"Order amount must be positive, got {amount!r}")
+            if price is not None:
+                try:
+                    price = float(price)
+                except (TypeError, ValueError):
+                    raise ValueError(f"Order price must be a number, got {price!r}") from None
+            if order_enum != "MARKET" and not (price is not None and price > 0):
+                raise ValueError(f"{order_enum} order requires a positive price, got {price!r}")
 
             if price is not None:
-                payload["price"] = price
+                payload = {
+                    "account_name": account,
+                    "connector_name": connector,
+                    "trading_pair": trading_pair,
+                    "trade_type": trade_type,
+                    "amount": amount,
+                    "order_type": order_enum,
+                    "price": price
+                }
+            else:
+                payload = {
+                    "account_name": account,
+                    "connector_name": connector,
+                    "trading_pair": trading_pair,
+                    "trade_type": trade_type,
+                    "amount": amount,
+                    "order_type": order_enum
+                }
 
             self.logger.info("placing_order", account=account, connector=connector, pair=trading_pair, side=side, amount=amount)
 
-            result = await self._request("POST", "/trading/orders", data=payload)
+            try:
+                result = await self._request("POST", "/trading/orders", data=payload)
+            finally:
+                # The order may change the position and balances, so drop any snapshot of them
+                self._positions_cache.pop((account, connector, trading_pair), None)
+                self._invalidate_order_reads()
 
             return {
                 "status": "executed",
@@ -360,10 +799,15 @@ class HummingbotGatewayClient:
             Cancellation result
         """
         account = account_name or self.account_name
+        connector = self._norm_connector(connector)
+        trading_pair = self._norm_pair(trading_pair)
         
         try:
             endpoint = f"/trading/{account}/{connector}/orders/{order_id}/cancel"
-            result = await self._request("POST", endpoint, data={"trading_pair": trading_pair})
+            try:
+                result = await self._request("POST", endpoint, data={"trading_pair": trading_pair})
+            finally:
+                self._invalidate_order_reads()
 
             return {
                 "status": "cancelled",
@@ -396,6 +840,8 @@ class HummingbotGatewayClient:
             Open orders
         """
         account = account_name or self.account_name
+        connector = self._norm_connector(connector) if connector else connector
+        trading_pair = self._norm_pair(trading_pair) if trading_pair else trading_pair
         
         try:
             filter_data = {}
@@ -408,10 +854,7 @@ class HummingbotGatewayClient:
 
             result = await self._request("POST", "/trading/orders/active", data=filter_data)
 
-            if isinstance(result, dict):
-                orders = result.get("rows", []) if "rows" in result else result.get("orders", [])
-            else:
-                orders = result if isinstance(result, list) else []
+            orders = _rows(result, "orders")
 
             return {
                 "status": "ok",
@@ -448,18 +891,25 @@ class HummingbotGatewayClient:
             Close result
         """
         account = account_name or self.account_name
+        connector = self._norm_connector(connector)
+        trading_pair = self._norm_pair(trading_pair)
         
         try:
-            # Get current position to determine side
-            positions = await self.get_positions(connector, trading_pair, account)
+            # Get current position to determine side. A recent snapshot is only
+            # trusted for the side; closing everything needs the live size.
+            entry = self._positions_cache.get((account, connector, trading_pair)) if amount is not None else None
+            if entry is not None and time.monotonic() - entry[0] < POSITIONS_CACHE_TTL:
+                position = entry[1]
+            else:
+                positions = await self.get_positions(connector, trading_pair, account)
+                position = positions["positions"][0] if positions.get("positions") else None
 
-            if not positions.get("positions"):
+            if position is None:
                 return {
                     "status": "no_position",
                     "message": f"No open position for {trading_pair}"
                 }
 
-            position = positions["positions"][0]
             position_size = float(position.get("amount", 0))
 
             if position_size == 0:
@@ -492,10 +942,27 @@ class HummingbotGatewayClient:
 
     # ==================== Market Data ====================
 
+    def _cached_market_data(self, connector: str, trading_pair: str) -> Optional[Dict[str, Any]]:
+        """Return market data from the price cache if the entry is still fresh"""
+        entry = self._price_cache.get((connector, trading_pair))
+        if entry is None or time.monotonic() >= entry[0]:
+            return None
+
+        return {
+            "status": "ok",
+            "connector": connector,
+            "trading_pair": trading_pair,
+            "price": entry[1],
+            "timestamp": entry[2]
+        }
+
     async def get_market_data(self, connector: str, trading_pair: str) -> Dict[str, Any]:
         """
         Get current market data (price).
 
+        Prices are reused for price_ttl seconds, and concurrent lookups of
+        the same pair share a single request.
+
         Args:
             connector: Exchange connector name
             trading_pair: Trading pair symbol
@@ -503,25 +970,138 @@ class HummingbotGatewayClient:
         Returns:
             Market data
         """
+        connector = self._norm_connector(connector)
+        trading_pair = self._norm_pair(trading_pair)
+        cached = self._cached_market_data(connector, trading_pair)
+        if cached is not None:
+            return cached
+
+        key = (connector, trading_pair)
+        lock = self._price_locks.get(key)
+        if lock is None:
+            lock = self._price_locks[key] = asyncio.Lock()
+
         try:
-            payload = {
-                "connector_name": connector,
-                "trading_pairs": [trading_pair]
-            }
+            async with lock:
+                # Another caller may have filled the cache while we waited
+                cached = self._cached_market_data(connector, trading_pair)
+                if cached is not None:
+                    return cached
+
+                return await self._fetch_market_data(connector, trading_pair)
+        finally:
+            # Keep only locks that are in use, so looked-up pairs do not pile up.
+            # A caller arriving after this builds a new lock and finds the cache filled
+            if not lock.locked() and self._price_locks.get(key) is lock:
+                del self._price_locks[key]
+
+    async def get_market_data_batch(self, connector: str, trading_pairs: List[str]) -> Dict[str, float]:
+        """
+        Get current prices for several pairs in one request.
 
-            result = await self._request("POST", "/market-data/prices", data=payload)
+        Pairs with a fresh cached price are not requested again.
 
-            # Parse prices from response
-            if isinstance(result, dict) and "prices" in result:
-                prices = result["prices"]
-                if isinstance(prices, dict) and trading_pair in prices:
-                    return {
-                        "status": "ok",
-                        "connector": connector,
-                        "trading_pair": trading_pair,
-                        "price": float(prices[trading_pair]),
-                        "timestamp": result.get("timestamp")
-                    }
+        Args:
+            connector: Exchange connector name
+            trading_pairs: Trading pair symbols
+
+        Returns:
+            Price per trading pair, keyed as passed in; pairs the Gateway
+            has no price for are omitted
+
+        Raises:
+            Exception: If the Gateway request fails
+        """
+        connector = self._norm_connector(connector)
+        normalized = {trading_pair: self._norm_pair(trading_pair) for trading_pair in trading_pairs}
+
+        prices = {}
+        missing = []
+        for trading_pair in dict.fromkeys(normalized.values()):
+            cached = self._cached_market_data(connector, trading_pair)
+            if cached is not None:
+                prices[trading_pair] = cached["price"]
+            else:
+                missing.append(trading_pair)
+
+        if missing:
+            fetched, _ = await self._fetch_prices(connector, missing)
+            prices.update(fetched)
+
+        return {
+            trading_pair: prices[pair]
+            for trading_pair, pair in normalized.items()
+            if pair in prices
+        }
+
+    async def _fetch_prices(self, connector: str, trading_pairs: List[str]) -> Tuple[Dict[str, float], Any]:
+        """Fetch prices for the given pairs in one request and refresh the price cache"""
+        payload = {
+            "connector_name": connector,
+            "trading_pairs": trading_pairs
+        }
+
+        result = await self._request("POST", "/market-data/prices", data=payload)
+
+        prices = {}
+        timestamp = None
+        if isinstance(result, dict) and isinstance(result.get("prices"), dict):
+            prices = {pair: float(price) for pair, price in result["prices"].items()}
+            timestamp = result.get("timestamp")
+
+        if self.price_ttl > 0:
+            expiry = time.monotonic() + self.price_ttl
+            for pair, price in prices.items():
+                self._price_cache[(connector, pair)] = (expiry, price, timestamp)
+
+        return prices, timestamp
+
+    def _queue_price_lookup(self, connector: str, trading_pair: str) -> asyncio.Future:
+        """
+        Add a pair to the connector's pending price batch.
+
+        The batch is sent once the current loop iteration yields, so
+        single-pair lookups issued together go out as one request.
+        """
+        pending = self._pending_prices.get(connector)
+        if pending is None:
+            loop = asyncio.get_running_loop()
+            pending = self._pending_prices[connector] = ([], loop.create_future())
+            # Mark a failure as retrieved in case every waiter was cancelled
+            pending[1].add_done_callback(lambda done: done.cancelled() or done.exception())
+            task = loop.create_task(self._flush_price_batch(connector))
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
+
+        pending[0].append(trading_pair)
+        return pending[1]
+
+    async def _flush_price_batch(self, connector: str):
+        """Send the connector's pending price batch and resolve its waiters"""
+        trading_pairs, future = self._pending_prices.pop(connector)
+        try:
+            result = await self._fetch_prices(connector, trading_pairs)
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+        else:
+            if not future.done():
+                future.set_result(result)
+
+    async def _fetch_market_data(self, connector: str, trading_pair: str) -> Dict[str, Any]:
+        """Fetch the current price for one pair through the batching queue"""
+        try:
+            # Shielded so one cancelled waiter does not cancel the batch for the others
+            prices, timestamp = await asyncio.shield(self._queue_price_lookup(connector, trading_pair))
+
+            if trading_pair in prices:
+                return {
+                    "status": "ok",
+                    "connector": connector,
+                    "trading_pair": trading_pair,
+                    "price": prices[trading_pair],
+                    "timestamp": timestamp
+                }
 
             return {
                 "status": "error",
@@ -550,6 +1130,9 @@ class HummingbotGatewayClient:
         Returns:
             Order book data
         """
+        connector = self._norm_connector(connector)
+        trading_pair = self._norm_pair(trading_pair)
+
         try:
             payload = {
                 "connector_name": connector,
@@ -593,6 +1176,9 @@ class HummingbotGatewayClient:
         Returns:
             Trade history
         """
+        connector = self._norm_connector(connector) if connector else connector
+        trading_pair = self._norm_pair(trading_pair) if trading_pair else trading_pair
+
         try:
             filter_data = {}
             if account_name:
@@ -604,12 +1190,15 @@ class HummingbotGatewayClient:
             if limit:
                 filter_data["limit"] = limit
 
-            result = await self._request("POST", "/trading/trades", data=filter_data)
-
-            if isinstance(result, dict):
-                trades = result.get("rows", []) if "rows" in result else result.get("trades", [])
+            if IJSON_AVAILABLE and limit and limit > STREAM_TRADES_THRESHOLD:
+                # Parse rows straight off the socket instead of buffering the body
+                trades = [
+                    trade async for trade in
+                    self._request_stream("POST", "/trading/trades", data=filter_data, alt_key="trades")
+                ]
             else:
-                trades = result if isinstance(result, list) else []
+                result = await self._request("POST", "/trading/trades", data=filter_data)
+                trades = _rows(result, "trades")
 
             return {
                 "status": "ok",
@@ -631,3 +1220,50 @@ class HummingbotGatewayClient:
         if self.session and not self.session.closed:
             await self.session.close()
             self.logger.info("gateway_client_closed")
+
+
+# ==================== Shared Clients ====================
+
+# One client per Gateway endpoint and credentials, so agents share a connection pool
+_shared_clients: Dict[Tuple[str, str, Optional[str], Optional[str]], HummingbotGatewayClient] = {}
+
+
+def get_gateway_client(
+    gateway_url: str = "http://localhost:8000",
+    account_name: str = "default",
+    username: Optional[str] = None,
+    password: Optional[str] = None
+) -> HummingbotGatewayClient:
+    """
+    Get the shared Gateway client for these connection settings.
+
+    The client opens its session lazily, so this is safe to call from
+    synchronous constructors.
+
+    Args:
+        gateway_url: Base URL of Hummingbot Gateway
+        account_name: Default account name to use for trading
+        username: Optional username for authentication
+        password: Optional password for authentication
+
+    Returns:
+        Shared client instance
+    """
+    key = (gateway_url.rstrip('/'), account_name, username, password)
+    client = _shared_clients.get(key)
+    if client is None:
+        client = _shared_clients[key] = HummingbotGatewayClient(
+            gateway_url=gateway_url,
+            account_name=account_name,
+            username=username,
+            password=password
+        )
+    return client
+
+
+async def shutdown_gateway_clients():
+    """Close and forget every shared Gateway client"""
+    clients = list(_shared_clients.values())
+    _shared_clients.clear()
+    for client in clients:
+        await client.close()